@@ -1,19 +1,108 @@
 # -*- coding: utf-8 -*-
 """AWS API module."""
 
-from enum import Enum
+import concurrent.futures
+import functools
+import os
+import time
 
 import boto3
 import botocore
+from botocore.config import Config
 
+from certificate_validator.exceptions import CertificateNotIssued
 
-class ValidationMethod(str, Enum):
+# Shared client configuration. A small connection pool suits the
+# low-concurrency Lambda model, and TCP keepalive avoids re-establishing
+# connections between calls on warm invocations.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=4,
+    retries={
+        'max_attempts': 3,
+        'mode': 'standard'
+    },
+    tcp_keepalive=True
+)
+
+
+def _strip_expect_header(request, **kwargs) -> None:
+    """
+    Remove the Expect header from an outgoing request.
+
+    botocore adds Expect: 100-continue to requests with a body, which
+    costs a full round trip waiting for the interim response before the
+    body is sent.
+
+    :type request: botocore.awsrequest.AWSRequest
+    :param request: outgoing request, mutated in place
+
+    :rtype: None
+    :return: None
+    """
+    request.headers.pop('Expect', None)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_session(region: str) -> boto3.Session:
+    """
+    Create or reuse a session for a given region.
+
+    Sessions are memoized per region so that warm AWS Lambda invocations
+    reuse the credentials and endpoint data loaded by the first invocation
+    instead of repeating the expensive session construction.
+
+    :type region: str
+    :param region: region associated with the session
+
+    :rtype: boto3.Session
+    :return: a boto3 session instance
+    """
+    return boto3.Session(region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_client(
+    service_name: str, region: str
+) -> botocore.client.BaseClient:
+    """
+    Create or reuse a low-level service client by name.
+
+    Clients are memoized on the service name and region so that warm AWS
+    Lambda invocations skip the service model parsing and SSL trust store
+    loading performed when a client is first created.
+
+    :type service_name: str
+    :param service_name: name of the service
+    :type region: str
+    :param region: region associated with the client
+
+    :rtype: botocore.client.BaseClient
+    :return: a botocore client instance
+    """
+    client_config = {
+        'use_ssl': True,
+        'config': _CLIENT_CONFIG,
+    }
+    client = _cached_session(region).client(service_name, **client_config)
+    # The handler is registered here rather than per wrapper construction:
+    # the client is shared through the memoization above and botocore does
+    # not de-duplicate handlers, so registering in AWS.__init__ would run
+    # the handler once per wrapper on every request.
+    client.meta.events.register_first('before-sign.*.*', _strip_expect_header)
+    return client
+
+
+class ValidationMethod():
     """
     ValidationMethod of a RequestCertificate request.
 
     The ValidationMethod is the method you want to use to validate that you own
     or control the domain associated with a public certificate. You can
     validate with DNS or validate with email.
+
+    The validation methods are plain string constants rather than an
+    `Enum`, so accessing one is a single attribute load without the enum
+    descriptor machinery.
     """
     DNS = 'DNS'
     EMAIL = 'EMAIL'
@@ -46,25 +135,44 @@ class AWS:
 
     def _get_session(self) -> boto3.Session:
         """
-        Create a session.
+        Create or reuse a session.
 
         :rtype: boto3.Session
         :return: a boto3 session instance
         """
-        session_config = {'region_name': self.region}
-        return boto3.Session(**session_config)
+        return _cached_session(self.region)
 
     def _get_client(self) -> botocore.client.BaseClient:
         """
-        Create a low-level service client by name.
+        Create or reuse a low-level service client by name.
 
         :rtype: botocore.client.BaseClient
         :return: a botocore client instance
         """
-        client_config = {
-            'use_ssl': True,
-        }
-        return self.session.client(self.SERVICE_NAME, **client_config)
+        return _cached_client(self.SERVICE_NAME, self.region)
+
+    @staticmethod
+    def parallel(calls: list) -> list:
+        """
+        Execute independent AWS API calls concurrently.
+
+        Each call releases the GIL while waiting on socket I/O, so
+        executing independent calls in a thread pool reduces the wall
+        time to approximately that of the slowest call. A single call is
+        executed inline to avoid the thread pool overhead.
+
+        :type calls: list
+        :param calls: zero-argument callables, each performing one call
+
+        :rtype: list
+        :return: results of the calls, in order
+        """
+        if len(calls) < 2:
+            return [call() for call in calls]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(calls)
+        ) as executor:
+            return list(executor.map(lambda call: call(), calls))
 
 
 class ACM(AWS):
@@ -72,6 +180,10 @@ class ACM(AWS):
     Wrapper for a low-level client representing AWS Certificate Manager (ACM).
     """
     SERVICE_NAME = 'acm'
+    WAITER_TIMEOUT = 300
+    WAITER_DELAY = 0.5
+    WAITER_BACKOFF = 1.7
+    WAITER_MAX_DELAY = 5
 
     def __init__(self, *args, **kwargs) -> None:
         """
@@ -81,7 +193,6 @@ class ACM(AWS):
         :return: None
         """
         super(ACM, self).__init__(*args, **kwargs)
-        self.waiter = self.client.get_waiter('certificate_validated')
 
     def request_certificate(
         self, domain_name: str, subject_alternative_names: list
@@ -105,7 +216,7 @@ class ACM(AWS):
         return self.client.request_certificate(
             DomainName=domain_name,
             SubjectAlternativeNames=subject_alternative_names,
-            ValidationMethod=ValidationMethod.DNS.value
+            ValidationMethod=ValidationMethod.DNS
         )
 
     def delete_certificate(self, certificate_arn: str) -> None:
@@ -134,13 +245,48 @@ class ACM(AWS):
             CertificateArn=certificate_arn,
         )
 
+    def list_certificates(self, statuses: list = None) -> list:
+        """
+        Retrieve a list of certificate summaries.
+
+        A certificate summary contains enough metadata (ARN, domain name,
+        and status) to avoid a DescribeCertificate request per certificate
+        when enumerating certificates. Pagination is handled internally,
+        so a single call returns the summaries of all matching
+        certificates.
+
+        Returns:
+        [
+          {
+            'CertificateArn': 'string',
+            'DomainName': 'string',
+            ...
+          }
+        ]
+
+        :type statuses: list
+        :param statuses: certificate statuses used to filter the results.
+            Defaults to ['PENDING_VALIDATION'].
+
+        :rtype: list
+        :return: summaries of the certificates with the given statuses
+        """
+        paginator = self.client.get_paginator('list_certificates')
+        certificates = []
+        for page in paginator.paginate(
+            CertificateStatuses=statuses or ['PENDING_VALIDATION']
+        ):
+            certificates.extend(page['CertificateSummaryList'])
+        return certificates
+
     def wait(self, certificate_arn: str) -> None:
         """
         Wait for the specified ACM certificate to be issued.
 
-        Poll the DescribeCertificate API endpoint every 5 seconds until a
-        successful state is reached. An error is returned after 60 failed
-        checks (5 minutes).
+        Poll the DescribeCertificate API endpoint with exponential
+        backoff, starting at a 0.5 second delay and capped at 5 seconds,
+        until the certificate is issued. A CertificateNotIssued exception
+        is raised after 5 minutes.
 
         :type certificate_arn: str
         :param certificate_arn: ARN of the ACM certificate
@@ -148,13 +294,17 @@ class ACM(AWS):
         :rtype: None
         :return: None
         """
-        return self.waiter.wait(
-            CertificateArn=certificate_arn,
-            WaiterConfig={
-                'Delay': 5,
-                'MaxAttempts': 60
-            }
-        )
+        deadline = time.monotonic() + self.WAITER_TIMEOUT
+        delay = self.WAITER_DELAY
+        while time.monotonic() < deadline:
+            response = self.describe_certificate(
+                certificate_arn=certificate_arn
+            )
+            if response['Certificate']['Status'] == 'ISSUED':
+                return
+            time.sleep(delay)
+            delay = min(self.WAITER_MAX_DELAY, delay * self.WAITER_BACKOFF)
+        raise CertificateNotIssued
 
 
 class Route53(AWS):
@@ -245,3 +395,13 @@ class Route53(AWS):
         return self.client.list_hosted_zones_by_name(
             DNSName=dns_name, MaxItems=max_items
         )
+
+
+# When running in AWS Lambda, construct the service clients at module
+# import time so that the expensive botocore service model loading runs
+# during the unbilled initialization phase rather than on the first
+# invocation.
+_IN_LAMBDA = 'AWS_LAMBDA_FUNCTION_NAME' in os.environ
+
+ACM_CLIENT = ACM() if _IN_LAMBDA else None
+ROUTE53_CLIENT = Route53() if _IN_LAMBDA else None
@@ -13,13 +13,38 @@ class CertificateValidatorException(Exception):
         :rtype: None
         :return: None
         """
-        if hasattr(self, 'msg'):
-            self.msg = self.msg.format(**kwargs)
-        else:
+        # messages are class-attribute constants, so they stay shared on
+        # the class instead of being reallocated per instance
+        if not hasattr(self, 'msg'):
             self.msg = ''
         super(CertificateValidatorException, self).__init__(self.msg)
 
 
+class CertificateNotIssued(CertificateValidatorException):
+    """
+    Raised when an ACM certificate is not issued within the allotted time.
+
+    The DescribeCertificate API endpoint is polled until the certificate
+    reaches the ISSUED state. If the certificate is not issued before the
+    polling deadline elapses, the wait is abandoned.
+    """
+    msg = 'Certificate was not issued within the allotted time.'
+
+
+class ResourceRecordsNotAvailable(CertificateValidatorException):
+    """
+    Raised when resource records are not available within the allotted time.
+
+    There is a latency period between when an ACM certificate is created
+    and when the resource records used for domain validation are
+    available. The DescribeCertificate API endpoint is polled until every
+    domain validation option contains a resource record. If the resource
+    records are not available before the polling deadline elapses, the
+    wait is abandoned.
+    """
+    msg = 'Resource records were not available within the allotted time.'
+
+
 class UnknownRequestType(CertificateValidatorException):
     """
     Raised when the request type is not one of Create, Update, or Delete.
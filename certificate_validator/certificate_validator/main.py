@@ -19,7 +19,7 @@ def handler(event: dict, context: object) -> dict:
     :param context: runtime information of the AWS Lambda function
     :type context: LambdaContext object
     """
-    logger.debug('Request: {}'.format(event))
+    logger.debug('Request: %s', event)
 
     request = Request(**event)
 
@@ -33,11 +33,9 @@ def handler(event: dict, context: object) -> dict:
     if request.resource_type == 'Custom::Certificate':
         certificate = Certificate(request, response)
         certificate.handler()
-        logger.debug('Response: {}'.format(certificate.response.dict()))
+        logger.debug('Response: %s', certificate.response.dict())
 
     if request.resource_type == 'Custom::CertificateValidator':
         certificate_validator = CertificateValidator(request, response)
         certificate_validator.handler()
-        logger.debug(
-            'Response: {}'.format(certificate_validator.response.dict())
-        )
+        logger.debug('Response: %s', certificate_validator.response.dict())
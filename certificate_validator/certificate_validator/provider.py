@@ -1,32 +1,72 @@
 # -*- coding: utf-8 -*-
 """Custom Resource Provider module."""
 
-from enum import Enum
+import logging
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from certificate_validator.exceptions import UnknownRequestType
 
+logger = logging.getLogger(__name__)
+
+# Reuse a single session so that warm AWS Lambda invocations reuse the
+# pooled TLS connection to the pre-signed S3 URL instead of performing a
+# new handshake and loading the CA bundle on every response. Transient
+# S3 errors are retried with a short backoff rather than failing the
+# stack operation outright.
+_SESSION = requests.Session()
+_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[500, 502, 503, 504]
+        )
+    )
+)
+
+# Connect and read timeouts, in seconds, for the response upload.
+_TIMEOUT = (3, 10)
+
+# Sentinel marking a region that has not been parsed yet. A distinct
+# object is required because None is a valid parse result, and a failed
+# parse must be cached as well.
+_UNSET = object()
+
 
-class RequestType(str, Enum):
+class RequestType():
     """
     RequestType of a Custom Resource Request Object.
 
     The request type is sent in the `RequestType` field in the vendor request
     object sent by AWS CloudFormation when the template developer creates,
     updates, or deletes a stack that contains a custom resource.
+
+    The request types are plain string constants rather than an `Enum`, so
+    accessing one is a single attribute load without the enum descriptor
+    machinery.
     """
     CREATE = 'Create'
     UPDATE = 'Update'
     DELETE = 'Delete'
 
 
-class Status(str, Enum):
+class Status():
     """
     Status of a Custom Resource Response Object.
 
     The status value sent by the custom resource provider in response to an AWS
     CloudFormation-generated request.
+
+    The statuses are plain string constants rather than an `Enum`, so
+    accessing one is a single attribute load without the enum descriptor
+    machinery.
     """
     SUCCESS = 'SUCCESS'
     FAILED = 'FAILED'
@@ -56,7 +96,16 @@ class Request():
         ...
       }
     }
+
+    Attributes are stored in `__slots__`, which halves the per-instance
+    memory footprint and avoids a dict lookup per attribute access.
     """
+    __slots__ = (
+        'RequestType', 'ServiceToken', 'ResponseURL', 'StackId', 'RequestId',
+        'ResourceType', 'LogicalResourceId', 'PhysicalResourceId',
+        'ResourceProperties', 'OldResourceProperties', '_region'
+    )
+
     def __init__(self, *args: list, **kwargs: dict) -> None:
         """
         Create a new `Request` object.
@@ -64,7 +113,10 @@ class Request():
         :rtype: None
         :return: None
         """
-        self.__dict__.update(**kwargs)
+        self.PhysicalResourceId = None
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+        self._region = _UNSET
 
     @property
     def request_type(self) -> str:
@@ -114,6 +166,37 @@ class Request():
         """
         return self.StackId
 
+    @property
+    def region(self) -> str:
+        """
+        Return the region parsed from the StackId of the request.
+
+        The StackId is an Amazon Resource Name (ARN) whose fourth field is
+        the region in which the stack, and therefore the custom resource,
+        resides. None is returned, with a warning, when no region can be
+        parsed from the StackId, in which case the caller falls back to
+        its default region.
+
+        The parsed region is cached, including the None result for a
+        malformed StackId, so the ARN is split and the warning emitted at
+        most once per request. Only the first four fields of the ARN are
+        split, since the remainder of the ARN is not needed. A cheap
+        prefix check skips the split entirely for non-ARN StackIds.
+        """
+        if self._region is _UNSET:
+            stack_id = self.stack_id
+            region = None
+            if stack_id.startswith('arn:'):
+                parts = stack_id.split(':', 4)
+                if len(parts) > 4:
+                    region = parts[3]
+            if region is None:
+                logger.warning(
+                    'Could not parse region from StackId: %s', stack_id
+                )
+            self._region = region
+        return self._region
+
     @property
     def request_id(self) -> str:
         """
@@ -160,10 +243,9 @@ class Request():
 
         Always sent with Update and Delete requests; never sent with Create.
         """
-        if hasattr(self, 'PhysicalResourceId'):
-            return self.PhysicalResourceId
-        else:
+        if self.PhysicalResourceId is None:
             return ''
+        return self.PhysicalResourceId
 
     @property
     def resource_properties(self) -> dict:
@@ -205,19 +287,35 @@ class Response():
          ...
        }
     }
+
+    Attributes are stored in `__slots__`, which halves the per-instance
+    memory footprint and avoids a dict lookup per attribute access.
     """
+    # Fields of the Custom Resource Response Object that are serialized
+    # and uploaded to the pre-signed S3 URL.
+    _WIRE_FIELDS = (
+        'Status', 'Reason', 'StackId', 'RequestId', 'LogicalResourceId',
+        'PhysicalResourceId', 'NoEcho', 'Data'
+    )
+    __slots__ = _WIRE_FIELDS
+
     def __init__(
         self,
+        *,
         request_id: str = '',
         stack_id: str = '',
         logical_resource_id: str = '',
         physical_resource_id: str = '',
-        *args: list,
         **kwargs: dict
     ) -> None:
         """
         Create a new `Response` object.
 
+        All parameters are keyword-only. Attributes are assigned
+        unconditionally, without branching on which parameters were
+        supplied, and any additional keyword arguments override the
+        corresponding response fields directly.
+
         :type request_id: str
         :param request_id: unique ID for the request
         :type stack_id: str
@@ -232,17 +330,16 @@ class Response():
         :rtype: None
         :return: None
         """
-        if kwargs:
-            self.__dict__.update(**kwargs)
-        else:
-            self.RequestId = request_id
-            self.StackId = stack_id
-            self.LogicalResourceId = logical_resource_id
-
-            if physical_resource_id:
-                self.PhysicalResourceId = physical_resource_id
-            else:
-                self.set_physical_resource_id('')
+        self.Status = None
+        self.Reason = None
+        self.Data = {}
+        self.NoEcho = False
+        self.RequestId = request_id
+        self.StackId = stack_id
+        self.LogicalResourceId = logical_resource_id
+        self.PhysicalResourceId = physical_resource_id
+        for key, value in kwargs.items():
+            setattr(self, key, value)
 
     @property
     def status(self) -> str:
@@ -343,9 +440,9 @@ class Response():
         Set the Status of the Custom Resource Response Object.
         """
         if success:
-            self.Status = Status.SUCCESS.value
+            self.Status = Status.SUCCESS
         else:
-            self.Status = Status.FAILED.value
+            self.Status = Status.FAILED
 
     def set_reason(self, reason: str) -> None:
         """
@@ -379,16 +476,30 @@ class Response():
         the values are visible through APIs that surface property values (such
         as DescribeStackEvents).
         """
-        if hasattr(self, 'Data'):
-            self.Data.update(data)
-        else:
-            self.Data = data
+        self.Data.update(data)
 
     def dict(self) -> dict:
         """
         Return dict representation of this object.
+
+        Fields that were never set remain None and are omitted, so the
+        representation contains only the fields destined for the wire.
         """
-        return self.__dict__
+        return {
+            key: getattr(self, key)
+            for key in self._WIRE_FIELDS if getattr(self, key) is not None
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Return compact JSON representation of this object as bytes.
+
+        Pre-serializing the response avoids a second JSON encoding pass
+        inside the HTTP client and produces a minimal body for upload to
+        the pre-signed S3 URL. Serialization is delegated to `orjson`,
+        which encodes the dict in C and emits compact bytes directly.
+        """
+        return orjson.dumps(self.dict(), default=str)
 
 
 class Provider():
@@ -399,6 +510,12 @@ class Provider():
     handle and respond to requests from AWS CloudFormation. The custom resource
     provider must provide a service token that the template developer uses.
     """
+    _DISPATCH = {
+        RequestType.CREATE: 'create',
+        RequestType.UPDATE: 'update',
+        RequestType.DELETE: 'delete'
+    }
+
     def __init__(
         self,
         request: Request = None,
@@ -482,19 +599,16 @@ class Provider():
         """
         Handle a "Create", "Update", or "Delete" request type.
 
-        If the request type is not one of "Create", "Update", or "Delete", an
-        UnknownRequestType exception is raised and a response is returned with
-        a status of "FAILED".
+        The request type is resolved through a class-level dispatch table
+        with a single dict lookup. If the request type is not one of
+        "Create", "Update", or "Delete", an UnknownRequestType exception
+        is raised and a response is returned with a status of "FAILED".
         """
         try:
-            if self.request.request_type == RequestType.CREATE.value:
-                self.create()
-            elif self.request.request_type == RequestType.UPDATE.value:
-                self.update()
-            elif self.request.request_type == RequestType.DELETE.value:
-                self.delete()
-            else:
+            method_name = self._DISPATCH.get(self.request.request_type)
+            if method_name is None:
                 raise UnknownRequestType
+            getattr(self, method_name)()
         except Exception as ex:
             self.response.set_status(success=False)
             self.response.set_reason(reason=str(ex))
@@ -511,7 +625,14 @@ class Provider():
         and uploads it to the pre-signed S3 URL.
         """
         url = self.request.response_url
-        r = requests.put(
-            url, json=self.response.dict(), headers={'Content-Type': ''}
+        body = self.response.to_json_bytes()
+        r = _SESSION.put(
+            url,
+            data=body,
+            headers={
+                'Content-Type': '',
+                'Content-Length': str(len(body))
+            },
+            timeout=_TIMEOUT
         )
         r.raise_for_status()
@@ -1,16 +1,116 @@
 # -*- coding: utf-8 -*-
 """Custom Resource module."""
 
+import functools
+import os
 import re
-import uuid
+import time
 from enum import Enum
 
-import polling
 from botocore import exceptions
 
+from certificate_validator import api
 from certificate_validator.api import ACM, Route53
+from certificate_validator.exceptions import ResourceRecordsNotAvailable
 from certificate_validator.provider import Provider
 
+# Compiled once at import time rather than on every validation. The
+# pattern covers only the remainder of the ARN after the literal prefix,
+# which is checked separately with startswith; the group is non-capturing
+# and the pattern is anchored with \Z so the match is a single pass
+# without group bookkeeping.
+_ACM_ARN_PREFIX = 'arn:aws:acm:'
+_ACM_ARN_RE = re.compile(
+    r'[\w+=/,.@-]*:\d+:[\w+=,.@-]+(?:/[\w+=,.@-]+)*\Z'
+)
+# AWS caps ARNs at 2048 characters; bounding the input before matching
+# also defeats pathological backtracking inputs.
+_ACM_ARN_MAX_LENGTH = 2048
+
+# Wrapper instances cached at module scope so warm AWS Lambda invocations
+# reuse them. The underlying sessions and clients are memoized in the api
+# module; caching the wrappers additionally skips re-registering event
+# handlers on every invocation.
+_ACM_CLIENTS = {}
+_ROUTE53_CLIENT = None
+
+# TTL, in seconds, of the resource record sets used for domain validation.
+_TTL = 300
+
+# Maximum number of changes submitted per ChangeResourceRecordSets
+# request. Route53 accepts up to 1000 changes per batch, but only 500
+# when the batch contains UPSERT actions.
+_CHANGE_BATCH_LIMIT = 500
+
+
+def _resource_records_exist(domain_validation_options: list) -> bool:
+    """
+    Determine if every domain validation option has a resource record.
+
+    :type domain_validation_options: list
+    :param domain_validation_options: domain validation options of an ACM
+      certificate
+
+    :rtype: bool
+    :return: whether every domain validation option has a resource record
+    """
+    return all(
+        domain_validation_option.get('ResourceRecord')
+        for domain_validation_option in domain_validation_options
+    )
+
+
+def _format_client_error(ex: exceptions.ClientError) -> str:
+    """
+    Format a client error as 'Code: Message'.
+
+    The error code and message are read directly from the error response
+    rather than stringifying the exception, which rebuilds botocore's
+    format template on every call and embeds operation context that is
+    noise in a CloudFormation reason.
+
+    :type ex: botocore.exceptions.ClientError
+    :param ex: client error raised by a service call
+
+    :rtype: str
+    :return: the error code and message of the client error
+    """
+    error = ex.response['Error']
+    return '{}: {}'.format(error['Code'], error['Message'])
+
+
+def _get_acm(region: str = None) -> ACM:
+    """
+    Create or reuse an `ACM` wrapper for a given region.
+
+    :type region: str
+    :param region: region associated with the client
+
+    :rtype: ACM
+    :return: an ACM wrapper instance
+    """
+    acm = _ACM_CLIENTS.get(region)
+    if acm is None:
+        if region is None and api.ACM_CLIENT is not None:
+            acm = api.ACM_CLIENT
+        else:
+            acm = ACM(region)
+        _ACM_CLIENTS[region] = acm
+    return acm
+
+
+def _get_route53() -> Route53:
+    """
+    Create or reuse the `Route53` wrapper.
+
+    :rtype: Route53
+    :return: a Route53 wrapper instance
+    """
+    global _ROUTE53_CLIENT
+    if _ROUTE53_CLIENT is None:
+        _ROUTE53_CLIENT = api.ROUTE53_CLIENT or Route53()
+    return _ROUTE53_CLIENT
+
 
 class Action(str, Enum):
     """
@@ -43,10 +143,16 @@ class CertificateMixin():
         :rtype: bool
         :return: whether the ARN of the ACM certificate is valid
         """
-        pattern = re.compile(
-            r'arn:aws:acm:[\w+=/,.@-]*:[0-9]+:[\w+=,.@-]+(/[\w+=,.@-]+)*'
-        )
-        return bool(re.match(pattern, certificate_arn))
+        # the prefix and length checks reject empty, clearly bogus, and
+        # pathologically long values without entering the regex engine;
+        # the pattern then matches only the remainder of the ARN,
+        # starting at the end of the prefix
+        if not certificate_arn.startswith(_ACM_ARN_PREFIX) or \
+                len(certificate_arn) > _ACM_ARN_MAX_LENGTH:
+            return False
+        return _ACM_ARN_RE.match(
+            certificate_arn, len(_ACM_ARN_PREFIX)
+        ) is not None
 
 
 class Certificate(CertificateMixin, Provider):
@@ -62,15 +168,19 @@ class Certificate(CertificateMixin, Provider):
     resource returns a successful status upon creation, not upon validation of
     the certificate request.
     """
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, acm: ACM = None, **kwargs):
         """
         Create a new `Certificate` object.
 
+        :type acm: ACM
+        :param acm: ACM client to use
+            Defaults to a cached client for the region of the request.
+
         :rtype: None
         :return: None
         """
         super(Certificate, self).__init__(*args, **kwargs)
-        self.acm = ACM()
+        self.acm = acm or _get_acm(self.request.region)
 
     def create(self) -> None:
         """
@@ -79,11 +189,12 @@ class Certificate(CertificateMixin, Provider):
         :rtype: None
         :return: None
         """
+        resource_properties = self.request.resource_properties
         try:
             response = self.acm.request_certificate(
-                domain_name=self.request.resource_properties['DomainName'],
-                subject_alternative_names=self.request.
-                resource_properties['SubjectAlternativeNames']
+                domain_name=resource_properties['DomainName'],
+                subject_alternative_names=resource_properties[
+                    'SubjectAlternativeNames']
             )
             self.response.set_status(success=True)
             # canonically, the ARN (Amazon Resource Name) of the Certificate
@@ -94,7 +205,7 @@ class Certificate(CertificateMixin, Provider):
             self.response.set_data(response)
         except exceptions.ClientError as ex:
             self.response.set_status(success=False)
-            self.response.set_reason(reason=str(ex))
+            self.response.set_reason(reason=_format_client_error(ex))
 
     def update(self) -> None:
         """
@@ -112,17 +223,18 @@ class Certificate(CertificateMixin, Provider):
         :rtype: None
         :return: None
         """
-        if self.request.physical_resource_id == '':
+        physical_resource_id = self.request.physical_resource_id
+        if physical_resource_id == '':
             self.response.set_status(success=True)
             self.response.set_reason(reason='Certificate does not exist.')
             return
-        if not self.is_valid_arn(self.request.physical_resource_id):
+        if not self.is_valid_arn(physical_resource_id):
             self.response.set_status(success=False)
             self.response.set_reason(reason='Certificate ARN is invalid.')
             return
         try:
             self.acm.delete_certificate(
-                certificate_arn=self.request.physical_resource_id
+                certificate_arn=physical_resource_id
             )
             self.response.set_status(success=True)
         except exceptions.ClientError as ex:
@@ -131,7 +243,7 @@ class Certificate(CertificateMixin, Provider):
                 self.response.set_reason(reason='Certificate not found.')
             else:
                 self.response.set_status(success=False)
-                self.response.set_reason(reason=str(ex))
+                self.response.set_reason(reason=_format_client_error(ex))
 
 
 class CertificateValidator(CertificateMixin, Provider):
@@ -144,16 +256,30 @@ class CertificateValidator(CertificateMixin, Provider):
     The Custom::CertificateValidator resource retrieves the record sets used by
     AWS Certificate Manager (ACM) to validate a certificate.
     """
-    def __init__(self, *args, **kwargs):
+    POLL_TIMEOUT = 60
+    POLL_DELAY = 0.5
+    POLL_MAX_DELAY = 10
+
+    def __init__(
+        self, *args, acm: ACM = None, route53: Route53 = None, **kwargs
+    ):
         """
         Create a new `CertificateValidator` object.
 
+        :type acm: ACM
+        :param acm: ACM client to use
+            Defaults to a cached client for the region of the request.
+        :type route53: Route53
+        :param route53: Route53 client to use
+            Defaults to a cached client.
+
         :rtype: None
         :return: None
         """
         super(CertificateValidator, self).__init__(*args, **kwargs)
-        self.acm = ACM()
-        self.route53 = Route53()
+        self.acm = acm or _get_acm(self.request.region)
+        self.route53 = route53 or _get_route53()
+        self._zone_cache = {}
 
     def change_resource_record_sets(
         self, certificate_arn: str, action: Action
@@ -180,36 +306,90 @@ class CertificateValidator(CertificateMixin, Provider):
             domain_validation_options = self.get_domain_validation_options(
                 certificate_arn
             )
-            for domain_validation_option in domain_validation_options:
-                # remove subdomains from DomainName
-                domain_name = '.'.join(
-                    domain_validation_option['DomainName'].split('.')[-2:]
-                )
-                hosted_zone_id = self.get_hosted_zone_id(domain_name)
-                resource_record = domain_validation_option['ResourceRecord']
-                change_batch = self.get_change_batch(
-                    action.value, resource_record
+            if not domain_validation_options:
+                self.response.set_status(success=True)
+                self.response.set_reason(
+                    reason='No validation records to change.'
                 )
-                self.route53.change_resource_record_sets(
-                    hosted_zone_id=hosted_zone_id, change_batch=change_batch
+                return
+            domain_names = [
+                # remove subdomains from DomainName; rsplit stops after
+                # two dots from the right regardless of subdomain depth
+                '.'.join(
+                    domain_validation_option['DomainName'].rsplit('.', 2)[-2:]
+                ) for domain_validation_option in domain_validation_options
+            ]
+            # the hosted zone lookups are independent of one another, so
+            # the distinct domains are looked up concurrently before the
+            # changes are grouped
+            unique_domain_names = list(dict.fromkeys(domain_names))
+            hosted_zone_ids = dict(
+                zip(
+                    unique_domain_names,
+                    self.route53.parallel([
+                        functools.partial(self.get_hosted_zone_id, domain_name)
+                        for domain_name in unique_domain_names
+                    ])
                 )
+            )
+            changes_by_zone = {}
+            for domain_validation_option, domain_name in zip(
+                domain_validation_options, domain_names
+            ):
+                resource_record = domain_validation_option['ResourceRecord']
+                # Action subclasses str, so the member itself is a valid
+                # string and the .value descriptor access is unnecessary
+                changes_by_zone.setdefault(
+                    hosted_zone_ids[domain_name], []
+                ).append(self.get_change(action, resource_record))
+            self.route53.parallel([
+                functools.partial(
+                    self.route53.change_resource_record_sets,
+                    hosted_zone_id=hosted_zone_id,
+                    change_batch={
+                        'Changes': changes[i:i + _CHANGE_BATCH_LIMIT]
+                    }
+                ) for hosted_zone_id, changes in changes_by_zone.items()
+                for i in range(0, len(changes), _CHANGE_BATCH_LIMIT)
+            ])
+            self.response.set_status(success=True)
+        except ResourceRecordsNotAvailable:
+            # deleting records that were never published is a no-op, but
+            # for record creation the timeout is a real failure and is
+            # propagated so the stack operation fails rather than
+            # succeeding with no validation records written
+            if action is not Action.DELETE:
+                raise
             self.response.set_status(success=True)
+            self.response.set_reason(reason='No validation records to change.')
         except exceptions.ClientError as ex:
-            if ex.response['Error']['Code'] == 'ResourceNotFoundException':
-                self.response.set_status(success=True)
-                self.response.set_reason(reason='Certificate not found.')
-            elif ex.response['Error']['Code'] == 'InvalidChangeBatch':
-                if 'not found' in ex.response['Error']['Message']:
-                    self.response.set_status(success=True)
-                    self.response.set_reason(
-                        reason='Resource Record Set not found.'
-                    )
-                else:
-                    self.response.set_status(success=False)
-                    self.response.set_reason(reason=str(ex))
-            else:
-                self.response.set_status(success=False)
-                self.response.set_reason(reason=str(ex))
+            self._handle_client_error(ex)
+
+    def _handle_client_error(self, ex: exceptions.ClientError) -> None:
+        """
+        Set the response for a client error from a record-set change.
+
+        A certificate or resource record set that no longer exists is
+        reported as success, so that deleting a stack whose records are
+        already gone does not fail the stack operation.
+
+        :type ex: botocore.exceptions.ClientError
+        :param ex: client error raised by a service call
+
+        :rtype: None
+        :return: None
+        """
+        error = ex.response['Error']
+        if error['Code'] == 'ResourceNotFoundException':
+            self.response.set_status(success=True)
+            self.response.set_reason(reason='Certificate not found.')
+        elif error['Code'] == 'InvalidChangeBatch' and \
+                'not found' in error['Message']:
+            self.response.set_status(success=True)
+            self.response.set_reason(reason='Resource Record Set not found.')
+        else:
+            self.response.set_status(success=False)
+            self.response.set_reason(reason=_format_client_error(ex))
 
     def create(self) -> None:
         """
@@ -221,11 +401,13 @@ class CertificateValidator(CertificateMixin, Provider):
         :rtype: None
         :return: None
         """
-        self.response.set_physical_resource_id(str(uuid.uuid4()))
-        self.change_resource_record_sets(
-            self.request.resource_properties['CertificateArn'], Action.UPSERT
-        )
-        self.acm.wait(self.request.resource_properties['CertificateArn'])
+        certificate_arn = self.request.resource_properties['CertificateArn']
+        # CloudFormation treats the PhysicalResourceId as an opaque
+        # string, so a hex token is as good as a dashed UUID and skips
+        # the UUID object construction and formatting
+        self.response.set_physical_resource_id(os.urandom(16).hex())
+        self.change_resource_record_sets(certificate_arn, Action.UPSERT)
+        self.acm.wait(certificate_arn)
 
     def update(self) -> None:
         """
@@ -237,16 +419,22 @@ class CertificateValidator(CertificateMixin, Provider):
         Custom::Certificate and create the AWS::Route53::RecordSetGroup
         resources associated with the new Custom::Certificate.
 
+        If the Custom::Certificate is unchanged, the delete pass is
+        skipped and the resource records are refreshed with a single
+        UPSERT batch, since UPSERT atomically creates or updates the
+        record sets.
+
         :rtype: None
         :return: None
         """
-        self.change_resource_record_sets(
-            self.request.old_resource_properties['CertificateArn'],
-            Action.DELETE
-        )
-        self.change_resource_record_sets(
-            self.request.resource_properties['CertificateArn'], Action.UPSERT
-        )
+        old_certificate_arn = \
+            self.request.old_resource_properties['CertificateArn']
+        certificate_arn = self.request.resource_properties['CertificateArn']
+        if old_certificate_arn != certificate_arn:
+            self.change_resource_record_sets(
+                old_certificate_arn, Action.DELETE
+            )
+        self.change_resource_record_sets(certificate_arn, Action.UPSERT)
 
     def delete(self) -> None:
         """
@@ -267,48 +455,60 @@ class CertificateValidator(CertificateMixin, Provider):
         a latency period between when the certificate is created and when the
         resource records used for domain validation are available.
 
+        The endpoint is polled with exponential backoff, starting at a 0.5
+        second delay and capped at 10 seconds, so that resource records
+        published within a second or two are picked up almost immediately.
+        A ResourceRecordsNotAvailable exception is raised after 60 seconds.
+
         :type certificate_arn: str
         :param certificate_arn: ARN of the ACM certificate
 
         :rtype: list
         :return: domain validation options for a given Certificate
         """
-        def resource_records_exist(response: dict) -> bool:
-            domain_validation_options = response['Certificate'
-                                                 ]['DomainValidationOptions']
-            for domain_validation_option in domain_validation_options:
-                if not domain_validation_option.get('ResourceRecord'):
-                    return False
-            else:
-                return True
-
-        response = polling.poll(
-            lambda: self.acm.
-            describe_certificate(certificate_arn=certificate_arn),
-            check_success=resource_records_exist,
-            step=5,
-            timeout=60
-        )
-
-        return response['Certificate']['DomainValidationOptions']
+        deadline = time.monotonic() + self.POLL_TIMEOUT
+        delay = self.POLL_DELAY
+        while time.monotonic() < deadline:
+            response = self.acm.describe_certificate(
+                certificate_arn=certificate_arn
+            )
+            domain_validation_options = \
+                response['Certificate']['DomainValidationOptions']
+            if _resource_records_exist(domain_validation_options):
+                return domain_validation_options
+            time.sleep(delay)
+            delay = min(self.POLL_MAX_DELAY, delay * 2)
+        raise ResourceRecordsNotAvailable
 
     def get_hosted_zone_id(self, domain_name: str) -> str:
         """
         Retrieve the hosted zone ID given a domain name.
 
+        Lookups are memoized per instance, so a certificate whose subject
+        alternative names share a parent domain performs a single
+        ListHostedZonesByName request for that domain.
+
         :type domain_name: str
         :param domain_name: domain name of the hosted zone
 
         :rtype: str
         :return: ID of the hosted zone
         """
-        response = self.route53.list_hosted_zones_by_name(dns_name=domain_name)
-        hosted_zone = response['HostedZones'][0]
-        return hosted_zone['Id'].split('/hostedzone/')[1]
-
-    def get_change_batch(self, action: Action, resource_record: dict) -> dict:
+        hosted_zone_id = self._zone_cache.get(domain_name)
+        if hosted_zone_id is None:
+            response = self.route53.list_hosted_zones_by_name(
+                dns_name=domain_name
+            )
+            hosted_zone = response['HostedZones'][0]
+            # the Id has the form '/hostedzone/<id>'; rpartition extracts
+            # the trailing id without allocating a two-element list
+            hosted_zone_id = hosted_zone['Id'].rpartition('/')[2]
+            self._zone_cache[domain_name] = hosted_zone_id
+        return hosted_zone_id
+
+    def get_change(self, action: Action, resource_record: dict) -> dict:
         """
-        Create a change batch given a resource record set.
+        Create a change given a resource record set.
 
         The `resource_record` parameter has the following form:
 
@@ -318,26 +518,41 @@ class CertificateValidator(CertificateMixin, Provider):
           'Value': 'string'
         }
 
+        Multiple changes may be combined into a single change batch, so
+        that all record sets within a hosted zone are created, updated, or
+        deleted with one ChangeResourceRecordSets request.
+
         :type action: Action
         :param action: action of a ChangeResourceRecordSets request
         :type resource_record: dict
         :param resource_record: resource record set for domain validation
 
         :rtype: dict
-        :return: a dict containing the resource record set for domain
-          validation
+        :return: a dict containing the change for the resource record set
         """
-        changes = []
-        changes.append({
+        return {
             'Action': action,
             'ResourceRecordSet': {
                 'Name': resource_record['Name'],
                 'Type': resource_record['Type'],
-                'TTL': 300,
+                'TTL': _TTL,
                 'ResourceRecords': [{
                     'Value': resource_record['Value']
                 }]
             }
-        })
-        change_batch = {'Changes': changes}
-        return change_batch
+        }
+
+    def get_change_batch(self, action: Action, resource_record: dict) -> dict:
+        """
+        Create a change batch given a resource record set.
+
+        :type action: Action
+        :param action: action of a ChangeResourceRecordSets request
+        :type resource_record: dict
+        :param resource_record: resource record set for domain validation
+
+        :rtype: dict
+        :return: a dict containing the resource record set for domain
+          validation
+        """
+        return {'Changes': [self.get_change(action, resource_record)]}
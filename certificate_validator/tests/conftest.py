@@ -0,0 +1,343 @@
+"""Shared pytest fixtures."""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from botocore import exceptions
+
+from certificate_validator import api, main, provider, resources
+from certificate_validator.api import ACM, AWS, Route53
+from certificate_validator.provider import Provider, Request, Response
+
+CERTIFICATE_ARN = 'arn:aws:acm:us-east-1:123:certificate/1337'
+
+REQUEST_KWARGS = {
+    'RequestType': 'request_type',
+    'ServiceToken': 'service_token',
+    'ResponseURL': 'response_url',
+    'StackId': 'stack_id',
+    'RequestId': 'request_id',
+    'ResourceType': 'resource_type',
+    'LogicalResourceId': 'logical_resource_id',
+    'PhysicalResourceId': 'physical_resource_id',
+    'ResourceProperties': {
+        'ServiceToken': 'service_token'
+    },
+    'OldResourceProperties': {
+        'ServiceToken': 'service_token'
+    }
+}
+
+RESPONSE_KWARGS = {
+    'Status': 'status',
+    'Reason': 'reason',
+    'StackId': 'stack_id',
+    'RequestId': 'request_id',
+    'LogicalResourceId': 'logical_resource_id',
+    'PhysicalResourceId': 'physical_resource_id',
+    'NoEcho': True,
+    'Data': {
+        'a': 1,
+        'b': 2,
+        'c': 3
+    }
+}
+
+CERTIFICATE_REQUEST_KWARGS = {
+    **REQUEST_KWARGS,
+    'ResourceType': 'Custom::Certificate',
+    'ResourceProperties': {
+        'ServiceToken': 'service_token',
+        'DomainName': 'certificate-validator.com',
+        'SubjectAlternativeNames': ['www.certificate-validator.com']
+    }
+}
+
+CERTIFICATE_VALIDATOR_REQUEST_KWARGS = {
+    **REQUEST_KWARGS,
+    'ResourceType': 'Custom::CertificateValidator',
+    'ResourceProperties': {
+        'ServiceToken': 'service_token',
+        'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1',
+    },
+    'OldResourceProperties': {
+        'ServiceToken': 'service_token',
+        'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/0',
+    }
+}
+
+BASE_EVENT = {
+    'RequestType': '',
+    'ServiceToken': '',
+    'ResponseURL': '',
+    'StackId': '',
+    'RequestId': '',
+    'ResourceType': '',
+    'LogicalResourceId': '',
+    'PhysicalResourceId': '',
+    'ResourceProperties': {
+        'ServiceToken': ''
+    },
+    'OldResourceProperties': {
+        'ServiceToken': ''
+    }
+}
+
+
+@contextmanager
+def swap_attr(obj, name, new):
+    """
+    Temporarily replace an attribute with a plain value.
+
+    A lighter-weight alternative to mock.patch for stubs that do not
+    need call recording; it skips the patcher bookkeeping entirely.
+    """
+    old = getattr(obj, name)
+    setattr(obj, name, new)
+    try:
+        yield new
+    finally:
+        setattr(obj, name, old)
+
+
+@pytest.fixture(autouse=True, scope='session')
+def _no_sleep():
+    """
+    Neutralize time.sleep for the whole suite.
+
+    No test legitimately needs to wait; the polling tests drive their
+    loops with stubbed clocks instead.
+    """
+    with patch('time.sleep'):
+        yield
+
+
+@pytest.fixture(scope='session')
+def client_error():
+    """
+    A generic ClientError shared by the failed-path tests.
+
+    The object is never mutated, so one instance can serve as the
+    side_effect for every test that exercises a generic AWS failure.
+    """
+    return exceptions.ClientError(
+        error_response={'Error': {
+            'Code': 'Code',
+            'Message': 'Message'
+        }},
+        operation_name='Operation'
+    )
+
+
+@pytest.fixture
+def boto3_session():
+    """Patch boto3.Session and reset the module-level client caches."""
+    api._cached_session.cache_clear()
+    api._cached_client.cache_clear()
+    resources._ACM_CLIENTS.clear()
+    resources._ROUTE53_CLIENT = None
+    with patch.object(api.boto3, 'Session') as mock_session:
+        mock_session.return_value = Mock()
+        yield mock_session
+
+
+@pytest.fixture
+def aws(boto3_session):
+    """An AWS wrapper backed by the patched boto3 session."""
+    return AWS(region='region')
+
+
+@pytest.fixture
+def acm(boto3_session):
+    """An ACM wrapper whose client is replaced with a Mock."""
+    acm = ACM()
+    acm.client = Mock()
+    return acm
+
+
+@pytest.fixture
+def route53(boto3_session):
+    """A Route53 wrapper whose client is replaced with a Mock."""
+    route53 = Route53()
+    route53.client = Mock()
+    return route53
+
+
+@pytest.fixture(scope='module')
+def request_obj():
+    """A Request shared by the tests of a module; it is never mutated."""
+    return Request(**REQUEST_KWARGS)
+
+
+@pytest.fixture
+def response_obj():
+    """A fresh Response for tests that mutate it."""
+    return Response(**RESPONSE_KWARGS)
+
+
+@pytest.fixture
+def provider_obj(request_obj, response_obj):
+    return Provider(request_obj, response_obj)
+
+
+@pytest.fixture
+def http_session():
+    """Patch the module-level requests session used to send responses."""
+    with patch.object(provider, '_SESSION') as mock_session:
+        yield mock_session
+
+
+@pytest.fixture
+def mock_send_response():
+    with patch.object(Provider, 'send_response') as mock_method:
+        yield mock_method
+
+
+@pytest.fixture
+def mock_request():
+    return Mock()
+
+
+@pytest.fixture
+def mock_response():
+    """
+    A Response stand-in limited to the real Response attributes.
+
+    The spec keeps attribute access to a fixed set instead of lazily
+    allocating a child mock per attribute, and catches typos in the
+    setter assertions.
+    """
+    return MagicMock(spec=Response)
+
+
+@pytest.fixture
+def certificate_request():
+    return Request(**CERTIFICATE_REQUEST_KWARGS)
+
+
+@pytest.fixture
+def cv_request():
+    return Request(**CERTIFICATE_VALIDATOR_REQUEST_KWARGS)
+
+
+@pytest.fixture
+def certificate_mocks(boto3_session):
+    """Patch the ACM calls exercised by the Certificate resource."""
+    with patch.object(resources.ACM, 'request_certificate') as \
+            mock_request_certificate, \
+            patch.object(resources.ACM, 'delete_certificate') as \
+            mock_delete_certificate:
+        mock_request_certificate.return_value = {
+            'CertificateArn': CERTIFICATE_ARN,
+        }
+        mock_delete_certificate.return_value = None
+        yield SimpleNamespace(
+            request_certificate=mock_request_certificate,
+            delete_certificate=mock_delete_certificate,
+        )
+
+
+@pytest.fixture
+def cv_mocks(boto3_session):
+    """
+    Patch the collaborators of CertificateValidator record-set changes.
+
+    The change_resource_record_sets tests stub the Route53 call and the
+    helper methods so only the orchestration logic under test runs.
+    """
+    with patch.object(resources.os, 'urandom') as mock_urandom, \
+            patch.object(resources.Route53, 'change_resource_record_sets') \
+            as mock_change_resource_record_sets, \
+            patch.object(
+                resources.CertificateValidator,
+                'get_domain_validation_options'
+            ) as mock_get_domain_validation_options, \
+            patch.object(
+                resources.CertificateValidator, 'get_hosted_zone_id'
+            ) as mock_get_hosted_zone_id, \
+            patch.object(resources.CertificateValidator, 'get_change') as \
+            mock_get_change:
+        mock_urandom.return_value = bytes.fromhex('1337')
+        mock_get_domain_validation_options.return_value = [{
+            'DomainName': 'certificate-validator.com',
+            'ResourceRecord': {
+                'Name': '_x1.certificate-validator.com.',
+                'Type': 'CNAME',
+                'Value': '_x2.acm-validations.aws.'
+            }
+        }]
+        mock_get_hosted_zone_id.return_value = 'Z23ABC4XYZL05B'
+        mock_get_change.return_value = {
+            'Action': 'UPSERT',
+            'ResourceRecordSet': {
+                'Name': '_x1.certificate-validator.com.',
+                'Type': 'CNAME',
+                'TTL': 300,
+                'ResourceRecords': [{
+                    'Value': '_x2.acm-validations.aws.'
+                }]
+            }
+        }
+        yield SimpleNamespace(
+            urandom=mock_urandom,
+            change_resource_record_sets=mock_change_resource_record_sets,
+            get_domain_validation_options=mock_get_domain_validation_options,
+            get_hosted_zone_id=mock_get_hosted_zone_id,
+            get_change=mock_get_change,
+        )
+
+
+@pytest.fixture
+def event():
+    """A shallow copy of the base handler event."""
+    return dict(BASE_EVENT)
+
+
+@pytest.fixture(scope='module')
+def _main_patchers():
+    """Patch the main module's collaborators once per test module."""
+    patchers = [
+        patch.object(main.logging, 'getLogger'),
+        patch.object(main, 'logger'),
+        patch.object(main, 'Request'),
+        patch.object(main, 'Response'),
+        patch.object(main, 'Certificate'),
+        patch.object(main, 'CertificateValidator'),
+    ]
+    mocks = tuple(patcher.start() for patcher in patchers)
+    yield mocks
+    for patcher in patchers:
+        patcher.stop()
+
+
+@pytest.fixture
+def main_mocks(_main_patchers):
+    """
+    Reset the main module's mocks for a test.
+
+    Call history is cleared and the return-value mocks are replaced so
+    attributes configured by one test do not leak into the next.
+    """
+    (
+        mock_logging, mock_logger, mock_request, mock_response,
+        mock_certificate, mock_certificate_validator
+    ) = _main_patchers
+    for mock in _main_patchers:
+        mock.reset_mock()
+    mock_request.return_value = Mock()
+    mock_response.return_value = Mock()
+    mock_certificate.return_value = Mock()
+    mock_certificate_validator.return_value = Mock()
+    return SimpleNamespace(
+        logger=mock_logger,
+        request_cls=mock_request,
+        request=mock_request.return_value,
+        response_cls=mock_response,
+        response=mock_response.return_value,
+        certificate_cls=mock_certificate,
+        certificate=mock_certificate.return_value,
+        certificate_validator_cls=mock_certificate_validator,
+        certificate_validator=mock_certificate_validator.return_value,
+    )
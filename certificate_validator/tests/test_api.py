@@ -1,164 +1,241 @@
-# -*- coding: utf-8 -*-
 """Tests for the `api` module."""
 
 from datetime import datetime
 from unittest.mock import Mock
 
-from certificate_validator.api import ACM, Route53, ValidationMethod
+import pytest
 
-from .base import AWSBaseTestCase, BaseTestCase
+from certificate_validator import api
+from certificate_validator.api import AWS, ValidationMethod
+from certificate_validator.exceptions import CertificateNotIssued
 
+from .conftest import swap_attr
 
-class ValidationMethodTestCase(BaseTestCase):
-    def setUp(self):
-        super(ValidationMethodTestCase, self).setUp()
 
-    def test_class(self):
-        self.assertEqual('DNS', ValidationMethod.DNS.value)
-        self.assertEqual('EMAIL', ValidationMethod.EMAIL.value)
+def test_validation_method():
+    assert 'DNS' == ValidationMethod.DNS
+    assert 'EMAIL' == ValidationMethod.EMAIL
 
 
-class AWSTestCase(AWSBaseTestCase):
-    def setUp(self):
-        super(AWSTestCase, self).setUp()
+def test_get_session(aws, boto3_session):
+    aws._get_session()
+    boto3_session.assert_called_with(region_name='region')
 
-    def test_get_session(self):
-        self.aws._get_session()
-        self.mock_session.assert_called_with(region_name='region')
 
-    def test_get_client(self):
-        self.aws._get_client()
-        self.session.client.assert_called_with(None, use_ssl=True)
+def test_get_client(aws, boto3_session):
+    aws._get_client()
+    boto3_session.return_value.client.assert_called_with(
+        None, use_ssl=True, config=api._CLIENT_CONFIG
+    )
 
 
-class ACMTestCase(AWSBaseTestCase):
-    def setUp(self):
-        super(ACMTestCase, self).setUp()
-        self.acm = ACM()
-        self.acm.client = Mock()
-        self.acm.waiter = Mock()
+def test_strip_expect_header(aws):
+    aws.client.meta.events.register_first.assert_called_with(
+        'before-sign.*.*', api._strip_expect_header
+    )
+    request = Mock()
+    request.headers = {'Expect': '100-continue'}
+    api._strip_expect_header(request)
+    assert {} == request.headers
 
-    def test_request_certificate(self):
-        expected = {'CertificateArn': 'string'}
-        self.acm.client.request_certificate.return_value = {
-            'CertificateArn': 'string'
+
+def test_parallel():
+    assert [] == AWS.parallel([])
+    assert [1] == AWS.parallel([lambda: 1])
+    assert [1, 2] == AWS.parallel([lambda: 1, lambda: 2])
+
+
+def test_session_is_cached(aws, boto3_session):
+    other = AWS(region='region')
+    assert aws.session is other.session
+    boto3_session.assert_called_once()
+
+
+def test_client_is_cached(aws, boto3_session):
+    other = AWS(region='region')
+    assert aws.client is other.client
+    boto3_session.return_value.client.assert_called_once()
+
+
+def test_request_certificate(acm):
+    expected = {'CertificateArn': 'string'}
+    acm.client.request_certificate.return_value = {'CertificateArn': 'string'}
+    actual = acm.request_certificate('example.com', ['www.example.com'])
+    acm.client.request_certificate.assert_called_with(
+        DomainName='example.com',
+        SubjectAlternativeNames=['www.example.com'],
+        ValidationMethod='DNS'
+    )
+    assert expected == actual
+
+
+def test_delete_certificate(acm):
+    certificate_arn = \
+        'arn:aws:acm:region:account-id:certificate/certificate-id'
+    acm.client.delete_certificate.return_value = None
+    actual = acm.delete_certificate(certificate_arn)
+    acm.client.delete_certificate.assert_called_with(
+        CertificateArn=certificate_arn
+    )
+    assert actual is None
+
+
+def test_describe_certificate(acm):
+    certificate_arn = \
+        'arn:aws:acm:region:account-id:certificate/certificate-id'
+    expected = {
+        'Certificate': {
+            'CertificateArn': certificate_arn,
+            'DomainName': 'example.com',
+            'SubjectAlternativeNames': ['www.example.com', ]
         }
-        actual = self.acm.request_certificate(
-            'example.com', ['www.example.com']
-        )
-        self.acm.client.request_certificate.assert_called_with(
-            DomainName='example.com',
-            SubjectAlternativeNames=['www.example.com'],
-            ValidationMethod='DNS'
-        )
-        self.assertEqual(expected, actual)
-
-    def test_delete_certificate(self):
-        certificate_arn = \
-            'arn:aws:acm:region:account-id:certificate/certificate-id'
-        expected = None
-        self.acm.client.delete_certificate.return_value = None
-        actual = self.acm.delete_certificate(certificate_arn)
-        self.acm.client.delete_certificate.assert_called_with(
-            CertificateArn=certificate_arn
-        )
-        self.assertEqual(expected, actual)
-
-    def test_describe_certificate(self):
-        certificate_arn = \
-            'arn:aws:acm:region:account-id:certificate/certificate-id'
-        expected = {
-            'Certificate': {
-                'CertificateArn': certificate_arn,
-                'DomainName': 'example.com',
-                'SubjectAlternativeNames': ['www.example.com', ]
-            }
+    }
+    acm.client.describe_certificate.return_value = {
+        'Certificate': {
+            'CertificateArn': certificate_arn,
+            'DomainName': 'example.com',
+            'SubjectAlternativeNames': ['www.example.com', ]
         }
-        self.acm.client.describe_certificate.return_value = {
-            'Certificate': {
-                'CertificateArn': certificate_arn,
-                'DomainName': 'example.com',
-                'SubjectAlternativeNames': ['www.example.com', ]
-            }
+    }
+    actual = acm.describe_certificate(certificate_arn)
+    acm.client.describe_certificate.assert_called_with(
+        CertificateArn=certificate_arn
+    )
+    assert expected == actual
+
+
+def test_list_certificates(acm):
+    paginator = Mock()
+    acm.client.get_paginator.return_value = paginator
+    paginator.paginate.return_value = [{
+        'CertificateSummaryList': [{
+            'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1'
+        }]
+    }, {
+        'CertificateSummaryList': [{
+            'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/2'
+        }]
+    }]
+    expected = [{
+        'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1'
+    }, {
+        'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/2'
+    }]
+    actual = acm.list_certificates()
+    acm.client.get_paginator.assert_called_with('list_certificates')
+    paginator.paginate.assert_called_with(
+        CertificateStatuses=['PENDING_VALIDATION']
+    )
+    assert expected == actual
+
+
+def test_list_certificates_statuses(acm):
+    paginator = Mock()
+    acm.client.get_paginator.return_value = paginator
+    paginator.paginate.return_value = []
+    actual = acm.list_certificates(statuses=['ISSUED'])
+    paginator.paginate.assert_called_with(CertificateStatuses=['ISSUED'])
+    assert [] == actual
+
+
+def test_wait(acm):
+    certificate_arn = \
+        'arn:aws:acm:region:account-id:certificate/certificate-id'
+    acm.client.describe_certificate.return_value = {
+        'Certificate': {
+            'Status': 'ISSUED'
         }
-        actual = self.acm.describe_certificate(certificate_arn)
-        self.acm.client.describe_certificate.assert_called_with(
-            CertificateArn=certificate_arn
-        )
-        self.assertEqual(expected, actual)
-
-    def test_wait(self):
-        certificate_arn = \
-            'arn:aws:acm:region:account-id:certificate/certificate-id'
-        self.acm.wait(certificate_arn)
-        self.acm.waiter.wait.assert_called_with(
-            CertificateArn=certificate_arn,
-            WaiterConfig={
-                'Delay': 5,
-                'MaxAttempts': 60
-            }
-        )
-
-
-class Route53TestCase(AWSBaseTestCase):
-    def setUp(self):
-        super(Route53TestCase, self).setUp()
-        self.route53 = Route53()
-        self.route53.client = Mock()
-
-    def test_change_resource_record_sets(self):
-        change_batch = {
-            'Changes': {
-                'Action': 'CREATE',
-                'ResourceRecordSet': {
-                    'Name': 'string',
-                    'Type': 'CNAME',
-                    'TTL': 300,
-                    'ResourceRecords': [{
-                        'Value': 'string'
-                    }]
-                }
-            }
+    }
+    acm.wait(certificate_arn)
+    acm.client.describe_certificate.assert_called_once_with(
+        CertificateArn=certificate_arn
+    )
+
+
+def test_wait_poll(acm):
+    certificate_arn = \
+        'arn:aws:acm:region:account-id:certificate/certificate-id'
+    acm.client.describe_certificate.side_effect = [{
+        'Certificate': {
+            'Status': 'PENDING_VALIDATION'
         }
-        expected = {
-            'ChangeInfo': {
-                'Id': 'string',
-                'Status': 'INSYNC',
-                'SubmittedAt': datetime(1970, 1, 1),
-                'Comment': 'string'
-            }
+    }, {
+        'Certificate': {
+            'Status': 'ISSUED'
         }
-        self.route53.client.change_resource_record_sets.return_value = {
-            'ChangeInfo': {
-                'Id': 'string',
-                'Status': 'INSYNC',
-                'SubmittedAt': datetime(1970, 1, 1),
-                'Comment': 'string'
-            }
+    }]
+    acm.wait(certificate_arn)
+    assert 2 == acm.client.describe_certificate.call_count
+
+
+def test_wait_timeout(acm):
+    certificate_arn = \
+        'arn:aws:acm:region:account-id:certificate/certificate-id'
+    acm.client.describe_certificate.return_value = {
+        'Certificate': {
+            'Status': 'PENDING_VALIDATION'
         }
-        actual = self.route53.change_resource_record_sets(
-            'Z23ABC4XYZL05B', change_batch
-        )
-        self.route53.client.change_resource_record_sets.assert_called_with(
-            HostedZoneId='Z23ABC4XYZL05B', ChangeBatch=change_batch
-        )
-        self.assertEqual(expected, actual)
-
-    def test_list_hosted_zones_by_name(self):
-        expected = {
-            'HostedZones': [{
-                'Id': 'string',
+    }
+    clock = iter([0, 0, 400])
+    with swap_attr(api.time, 'monotonic', lambda: next(clock)):
+        with pytest.raises(CertificateNotIssued):
+            acm.wait(certificate_arn)
+
+
+def test_change_resource_record_sets(route53):
+    change_batch = {
+        'Changes': {
+            'Action': 'CREATE',
+            'ResourceRecordSet': {
                 'Name': 'string',
-            }]
+                'Type': 'CNAME',
+                'TTL': 300,
+                'ResourceRecords': [{
+                    'Value': 'string'
+                }]
+            }
         }
-        self.route53.client.list_hosted_zones_by_name.return_value = {
-            'HostedZones': [{
-                'Id': 'string',
-                'Name': 'string',
-            }]
+    }
+    expected = {
+        'ChangeInfo': {
+            'Id': 'string',
+            'Status': 'INSYNC',
+            'SubmittedAt': datetime(1970, 1, 1),
+            'Comment': 'string'
+        }
+    }
+    route53.client.change_resource_record_sets.return_value = {
+        'ChangeInfo': {
+            'Id': 'string',
+            'Status': 'INSYNC',
+            'SubmittedAt': datetime(1970, 1, 1),
+            'Comment': 'string'
         }
-        actual = self.route53.list_hosted_zones_by_name('example.com')
-        self.route53.client.list_hosted_zones_by_name.assert_called_with(
-            DNSName='example.com', MaxItems='1'
-        )
-        self.assertEqual(expected, actual)
+    }
+    actual = route53.change_resource_record_sets(
+        'Z23ABC4XYZL05B', change_batch
+    )
+    route53.client.change_resource_record_sets.assert_called_with(
+        HostedZoneId='Z23ABC4XYZL05B', ChangeBatch=change_batch
+    )
+    assert expected == actual
+
+
+def test_list_hosted_zones_by_name(route53):
+    expected = {
+        'HostedZones': [{
+            'Id': 'string',
+            'Name': 'string',
+        }]
+    }
+    route53.client.list_hosted_zones_by_name.return_value = {
+        'HostedZones': [{
+            'Id': 'string',
+            'Name': 'string',
+        }]
+    }
+    actual = route53.list_hosted_zones_by_name('example.com')
+    route53.client.list_hosted_zones_by_name.assert_called_with(
+        DNSName='example.com', MaxItems='1'
+    )
+    assert expected == actual
@@ -1,29 +1,37 @@
-# -*- coding: utf-8 -*-
 """Tests for the `exceptions` module."""
 
 from certificate_validator.exceptions import (
-    CertificateValidatorException, UnknownRequestType
+    CertificateNotIssued, CertificateValidatorException,
+    ResourceRecordsNotAvailable, UnknownRequestType
 )
 
-from .base import BaseTestCase
 
+def test_certificate_validator_exception():
+    e = CertificateValidatorException()
+    assert '' == e.msg
 
-class CertificateValidatorExceptionTestCase(BaseTestCase):
-    def setUp(self):
-        super(CertificateValidatorExceptionTestCase, self).setUp()
 
-    def test_init(self):
-        e = CertificateValidatorException()
-        self.assertEqual('', e.msg)
+def test_certificate_not_issued():
+    e = CertificateNotIssued()
+    assert 'Certificate was not issued within the allotted time.' == e.msg
 
 
-class UnknownRequestTypeTestCase(BaseTestCase):
-    def setUp(self):
-        super(UnknownRequestTypeTestCase, self).setUp()
+def test_resource_records_not_available():
+    e = ResourceRecordsNotAvailable()
+    assert (
+        'Resource records were not available within the allotted time.'
+        == e.msg
+    )
 
-    def test_init(self):
-        e = UnknownRequestType()
-        self.assertEqual(
-            'Unknown RequestType: Must be one of: Create, Update, or Delete.',
-            e.msg
-        )
+
+def test_unknown_request_type():
+    e = UnknownRequestType()
+    assert (
+        'Unknown RequestType: Must be one of: Create, Update, or Delete.'
+        == e.msg
+    )
+
+
+def test_msg_shared_with_class():
+    e = UnknownRequestType()
+    assert UnknownRequestType.msg is e.msg
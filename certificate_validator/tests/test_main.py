@@ -1,68 +1,62 @@
-# -*- coding: utf-8 -*-
 """Tests for the `main` module."""
 
 from unittest import mock
 
 from certificate_validator.main import handler
 
-from .base import MainBaseTestCase
 
-
-class MainTestCase(MainBaseTestCase):
-    def setUp(self):
-        super(MainTestCase, self).setUp()
-
-    def test_handler_nop(self):
-        handler(self.event, None)
-        self.mock_logger.debug.assert_called_with(
-            'Request: {}'.format(self.event)
-        )
-        self.mock_request.assert_called_with(**self.event)
-        self.mock_response.assert_called_with(
-            request_id=self.request.request_id,
-            stack_id=self.request.stack_id,
-            logical_resource_id=self.request.logical_resource_id,
-            physical_resource_id=self.request.physical_resource_id
-        )
-
-    def test_handler_certificate(self):
-        self.event['ResourceType'] = 'Custom::Certificate'
-        self.request.resource_type = 'Custom::Certificate'
-        handler(self.event, None)
-        self.mock_logger.debug.assert_has_calls([
-            mock.call('Request: {}'.format(self.event)),
-            mock.call('Response: {}'.format(self.certificate.response.dict()))
-        ])
-        self.mock_request.assert_called_with(**self.event)
-        self.mock_response.assert_called_with(
-            request_id=self.request.request_id,
-            stack_id=self.request.stack_id,
-            logical_resource_id=self.request.logical_resource_id,
-            physical_resource_id=self.request.physical_resource_id
-        )
-        self.mock_certificate.assert_called_with(self.request, self.response)
-        self.certificate.handler.assert_called_once()
-
-    def test_handler_certificate_validator(self):
-        self.event['ResourceType'] = 'Custom::CertificateValidator'
-        self.request.resource_type = 'Custom::CertificateValidator'
-        handler(self.event, None)
-        self.mock_logger.debug.assert_has_calls([
-            mock.call('Request: {}'.format(self.event)),
-            mock.call(
-                'Response: {}'.format(
-                    self.certificate_validator.response.dict()
-                )
-            )
-        ])
-        self.mock_request.assert_called_with(**self.event)
-        self.mock_response.assert_called_with(
-            request_id=self.request.request_id,
-            stack_id=self.request.stack_id,
-            logical_resource_id=self.request.logical_resource_id,
-            physical_resource_id=self.request.physical_resource_id
-        )
-        self.mock_certificate_validator.assert_called_with(
-            self.request, self.response
+def test_handler_nop(event, main_mocks):
+    handler(event, None)
+    main_mocks.logger.debug.assert_called_with('Request: %s', event)
+    main_mocks.request_cls.assert_called_with(**event)
+    main_mocks.response_cls.assert_called_with(
+        request_id=main_mocks.request.request_id,
+        stack_id=main_mocks.request.stack_id,
+        logical_resource_id=main_mocks.request.logical_resource_id,
+        physical_resource_id=main_mocks.request.physical_resource_id
+    )
+
+
+def test_handler_certificate(event, main_mocks):
+    event['ResourceType'] = 'Custom::Certificate'
+    main_mocks.request.resource_type = 'Custom::Certificate'
+    handler(event, None)
+    main_mocks.logger.debug.assert_has_calls([
+        mock.call('Request: %s', event),
+        mock.call('Response: %s', main_mocks.certificate.response.dict())
+    ])
+    main_mocks.request_cls.assert_called_with(**event)
+    main_mocks.response_cls.assert_called_with(
+        request_id=main_mocks.request.request_id,
+        stack_id=main_mocks.request.stack_id,
+        logical_resource_id=main_mocks.request.logical_resource_id,
+        physical_resource_id=main_mocks.request.physical_resource_id
+    )
+    main_mocks.certificate_cls.assert_called_with(
+        main_mocks.request, main_mocks.response
+    )
+    main_mocks.certificate.handler.assert_called_once()
+
+
+def test_handler_certificate_validator(event, main_mocks):
+    event['ResourceType'] = 'Custom::CertificateValidator'
+    main_mocks.request.resource_type = 'Custom::CertificateValidator'
+    handler(event, None)
+    main_mocks.logger.debug.assert_has_calls([
+        mock.call('Request: %s', event),
+        mock.call(
+            'Response: %s',
+            main_mocks.certificate_validator.response.dict()
         )
-        self.certificate_validator.handler.assert_called_once()
+    ])
+    main_mocks.request_cls.assert_called_with(**event)
+    main_mocks.response_cls.assert_called_with(
+        request_id=main_mocks.request.request_id,
+        stack_id=main_mocks.request.stack_id,
+        logical_resource_id=main_mocks.request.logical_resource_id,
+        physical_resource_id=main_mocks.request.physical_resource_id
+    )
+    main_mocks.certificate_validator_cls.assert_called_with(
+        main_mocks.request, main_mocks.response
+    )
+    main_mocks.certificate_validator.handler.assert_called_once()
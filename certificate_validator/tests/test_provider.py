@@ -1,248 +1,307 @@
-# -*- coding: utf-8 -*-
 """Tests for the `provider` module."""
 
+import json
 from unittest.mock import patch
 
+import pytest
+
 from certificate_validator.provider import (
-    Provider, Request, RequestType, Response, Status
+    _TIMEOUT, Provider, Request, RequestType, Response, Status
 )
 
-from .base import (
-    BaseTestCase, ProviderBaseTestCase, RequestBaseTestCase,
-    ResponseBaseTestCase
+from .conftest import REQUEST_KWARGS
+
+# per-RequestType kwargs variants, built once instead of re-merging the
+# base kwargs inside each handler test
+HANDLER_REQUEST_KWARGS = {
+    request_type: {
+        **REQUEST_KWARGS, 'RequestType': request_type
+    }
+    for request_type in ('Create', 'Update', 'Delete', 'Unknown')
+}
+
+
+def test_request_type_class():
+    assert 'Create' == RequestType.CREATE
+    assert 'Update' == RequestType.UPDATE
+    assert 'Delete' == RequestType.DELETE
+
+
+def test_status_class():
+    assert 'SUCCESS' == Status.SUCCESS
+    assert 'FAILED' == Status.FAILED
+
+
+def test_request_init():
+    kwargs = {
+        'RequestType': 'Create',
+        'ServiceToken': 'service_token',
+        'ResponseURL': 'response_url'
+    }
+    r = Request(**kwargs)
+    assert 'Create' == r.RequestType
+    assert 'service_token' == r.ServiceToken
+    assert 'response_url' == r.ResponseURL
+
+
+@pytest.mark.parametrize(
+    'attr, expected', [
+        ('request_type', 'request_type'),
+        ('service_token', 'service_token'),
+        ('response_url', 'response_url'),
+        ('stack_id', 'stack_id'),
+        ('request_id', 'request_id'),
+        ('resource_type', 'resource_type'),
+        ('logical_resource_id', 'logical_resource_id'),
+        ('physical_resource_id', 'physical_resource_id'),
+        ('resource_properties', {
+            'ServiceToken': 'service_token'
+        }),
+        ('old_resource_properties', {
+            'ServiceToken': 'service_token'
+        }),
+    ]
 )
+def test_request_attributes(request_obj, attr, expected):
+    assert getattr(request_obj, attr) == expected
 
 
-class RequestTypeTestCase(BaseTestCase):
-    def setUp(self):
-        super(RequestTypeTestCase, self).setUp()
-
-    def test_class(self):
-        self.assertEqual('Create', RequestType.CREATE.value)
-        self.assertEqual('Update', RequestType.UPDATE.value)
-        self.assertEqual('Delete', RequestType.DELETE.value)
-
-
-class StatusTestCase(BaseTestCase):
-    def setUp(self):
-        super(StatusTestCase, self).setUp()
-
-    def test_class(self):
-        self.assertEqual('SUCCESS', Status.SUCCESS.value)
-        self.assertEqual('FAILED', Status.FAILED.value)
-
-
-class RequestTestCase(RequestBaseTestCase):
-    def setUp(self):
-        super(RequestTestCase, self).setUp()
-
-    def test_init(self):
-        kwargs = {'a': 1, 'b': 2, 'c': 3}
-        r = Request(**kwargs)
-        self.assertEqual(1, r.a)
-        self.assertEqual(2, r.b)
-        self.assertEqual(3, r.c)
-
-    def test_request_type(self):
-        self.assertEqual('request_type', self.request.request_type)
-
-    def test_service_token(self):
-        self.assertEqual('service_token', self.request.service_token)
-
-    def test_response_url(self):
-        self.assertEqual('response_url', self.request.response_url)
-
-    def test_stack_id(self):
-        self.assertEqual('stack_id', self.request.stack_id)
-
-    def test_request_id(self):
-        self.assertEqual('request_id', self.request.request_id)
-
-    def test_resource_type(self):
-        self.assertEqual('resource_type', self.request.resource_type)
-
-    def test_logical_resource_id(self):
-        self.assertEqual(
-            'logical_resource_id', self.request.logical_resource_id
-        )
-
-    def test_physical_resource_id(self):
-        self.assertEqual(
-            'physical_resource_id', self.request.physical_resource_id
-        )
-        kwargs = {}
-        r = Request(**kwargs)
-        self.assertEqual('', r.physical_resource_id)
-
-    def test_resource_properties(self):
-        self.assertEqual({'ServiceToken': 'service_token'},
-                         self.request.resource_properties)
-
-    def test_old_resource_properties(self):
-        self.assertEqual({'ServiceToken': 'service_token'},
-                         self.request.old_resource_properties)
-
-
-class ResponseTestCase(ResponseBaseTestCase):
-    def setUp(self):
-        super(ResponseTestCase, self).setUp()
-
-    def test_init(self):
-        kwargs = {'a': 1, 'b': 2, 'c': 3}
-        r = Response(**kwargs)
-        self.assertEqual(1, r.a)
-        self.assertEqual(2, r.b)
-        self.assertEqual(3, r.c)
-        r = Response(
-            request_id='request_id',
-            stack_id='stack_id',
-            logical_resource_id='logical_resource_id'
-        )
-        self.assertEqual('request_id', r.request_id)
-        self.assertEqual('stack_id', r.stack_id)
-        self.assertEqual('logical_resource_id', r.logical_resource_id)
-        self.assertEqual('', r.physical_resource_id)
-        r = Response(
-            request_id='request_id',
-            stack_id='stack_id',
-            logical_resource_id='logical_resource_id',
-            physical_resource_id='physical_resource_id'
-        )
-        self.assertEqual('request_id', r.request_id)
-        self.assertEqual('stack_id', r.stack_id)
-        self.assertEqual('logical_resource_id', r.logical_resource_id)
-        self.assertEqual('physical_resource_id', r.physical_resource_id)
-
-    def test_status(self):
-        self.assertEqual('status', self.response.status)
-
-    def test_reason(self):
-        self.assertEqual('reason', self.response.reason)
-
-    def test_stack_id(self):
-        self.assertEqual('stack_id', self.response.stack_id)
-
-    def test_request_id(self):
-        self.assertEqual('request_id', self.response.request_id)
-
-    def test_logical_resource_id(self):
-        self.assertEqual(
-            'logical_resource_id', self.response.logical_resource_id
-        )
-
-    def test_physical_resource_id(self):
-        self.assertEqual(
-            'physical_resource_id', self.response.physical_resource_id
-        )
-
-    def test_no_echo(self):
-        self.assertEqual(True, self.response.no_echo)
-
-    def test_data(self):
-        self.assertEqual({'a': 1, 'b': 2, 'c': 3}, self.response.data)
-
-    def test_set_status(self):
-        self.response.set_status(True)
-        self.assertEqual('SUCCESS', self.response.status)
-        self.response.set_status(False)
-        self.assertEqual('FAILED', self.response.status)
-
-    def test_set_reason(self):
-        self.response.set_reason('')
-        self.assertEqual('', self.response.reason)
-
-    def test_set_physical_resource_id(self):
-        self.response.set_physical_resource_id('1337')
-        self.assertEqual('1337', self.response.physical_resource_id)
-
-    def test_set_data(self):
-        self.response.set_data({'a': 1, 'b': 2, 'c': 3})
-        self.assertEqual({'a': 1, 'b': 2, 'c': 3}, self.response.data)
-        kwargs = {}
-        r = Response(**kwargs)
-        r.set_data({'a': 1, 'b': 2, 'c': 3})
-        self.assertEqual({'a': 1, 'b': 2, 'c': 3}, r.data)
-
-    def test_dict(self):
-        self.kwargs = self.response.dict()
-
-
-class ProviderTestCase(ProviderBaseTestCase):
-    def setUp(self):
-        super(ProviderTestCase, self).setUp()
-
-    def test_init(self):
-        self.assertEqual(self.provider.request, self.request)
-        self.assertEqual(self.provider.response, self.response)
-
-    def test_set_response(self):
-        r = Response()
-        self.provider._set_response(r)
-        self.assertEqual(r, self.provider.response)
-
-    def test_create(self):
-        with self.assertRaises(NotImplementedError):
-            self.provider.create()
-
-    def test_update(self):
-        with self.assertRaises(NotImplementedError):
-            self.provider.update()
-
-    def test_delete(self):
-        with self.assertRaises(NotImplementedError):
-            self.provider.delete()
-
-    def test_handler_create(self):
-        self.mock_create = patch.object(Provider, 'create').start()
-        self.mock_send_response = patch.object(Provider,
-                                               'send_response').start()
-        self.request_kwargs['RequestType'] = 'Create'
-        request = Request(**self.request_kwargs)
-        provider = Provider(request, self.response)
-        provider.handler()
-        self.mock_create.assert_called_once()
-        self.mock_send_response.assert_called_once()
-
-    def test_handler_update(self):
-        self.mock_update = patch.object(Provider, 'update').start()
-        self.mock_send_response = patch.object(Provider,
-                                               'send_response').start()
-        self.request_kwargs['RequestType'] = 'Update'
-        request = Request(**self.request_kwargs)
-        provider = Provider(request, self.response)
-        provider.handler()
-        self.mock_update.assert_called_once()
-        self.mock_send_response.assert_called_once()
-
-    def test_handler_delete(self):
-        self.mock_delete = patch.object(Provider, 'delete').start()
-        self.mock_send_response = patch.object(Provider,
-                                               'send_response').start()
-        self.request_kwargs['RequestType'] = 'Delete'
-        request = Request(**self.request_kwargs)
-        provider = Provider(request, self.response)
-        provider.handler()
-        self.mock_delete.assert_called_once()
-        self.mock_send_response.assert_called_once()
-
-    def test_handler_unknown(self):
-        self.mock_send_response = patch.object(Provider,
-                                               'send_response').start()
-        self.request_kwargs['RequestType'] = 'Unknown'
-        request = Request(**self.request_kwargs)
-        provider = Provider(request, self.response)
+def test_region():
+    kwargs = {
+        'StackId':
+            'arn:aws:cloudformation:us-west-2:123456789012:'
+            'stack/stack-name/guid'
+    }
+    r = Request(**kwargs)
+    assert 'us-west-2' == r.region
+
+
+@pytest.mark.parametrize(
+    'stack_id', ['stack_id', 'arn:aws'], ids=['not_an_arn', 'too_few_fields']
+)
+def test_region_unparseable(stack_id):
+    r = Request(StackId=stack_id)
+    with patch('certificate_validator.provider.logger') as mock_logger:
+        assert r.region is None
+    mock_logger.warning.assert_called_once()
+
+
+def test_region_unparseable_cached():
+    r = Request(StackId='stack_id')
+    with patch('certificate_validator.provider.logger') as mock_logger:
+        assert r.region is None
+        assert r.region is None
+    mock_logger.warning.assert_called_once()
+
+
+def test_region_caching():
+    kwargs = {
+        'StackId':
+            'arn:aws:cloudformation:us-west-2:123456789012:'
+            'stack/stack-name/guid'
+    }
+    r = Request(**kwargs)
+    region = r.region
+    region2 = r.region
+    assert region is region2
+
+
+def test_physical_resource_id_default():
+    kwargs = {}
+    r = Request(**kwargs)
+    assert '' == r.physical_resource_id
+
+
+@pytest.mark.parametrize(
+    'kwargs, expected', [
+        ({
+            'Status': 'status',
+            'Reason': 'reason',
+            'NoEcho': True
+        }, {
+            'Status': 'status',
+            'Reason': 'reason',
+            'NoEcho': True
+        }),
+        ({}, {
+            'data': {},
+            'no_echo': False
+        }),
+        ({
+            'request_id': 'request_id',
+            'stack_id': 'stack_id',
+            'logical_resource_id': 'logical_resource_id'
+        }, {
+            'request_id': 'request_id',
+            'stack_id': 'stack_id',
+            'logical_resource_id': 'logical_resource_id',
+            'physical_resource_id': ''
+        }),
+        ({
+            'request_id': 'request_id',
+            'stack_id': 'stack_id',
+            'logical_resource_id': 'logical_resource_id',
+            'physical_resource_id': 'physical_resource_id'
+        }, {
+            'request_id': 'request_id',
+            'stack_id': 'stack_id',
+            'logical_resource_id': 'logical_resource_id',
+            'physical_resource_id': 'physical_resource_id'
+        }),
+    ],
+    ids=['wire_fields', 'defaults', 'without_physical_id', 'all_ids']
+)
+def test_response_init(kwargs, expected):
+    r = Response(**kwargs)
+    for attr, value in expected.items():
+        assert getattr(r, attr) == value
+
+
+@pytest.mark.parametrize(
+    'attr, expected', [
+        ('status', 'status'),
+        ('reason', 'reason'),
+        ('stack_id', 'stack_id'),
+        ('request_id', 'request_id'),
+        ('logical_resource_id', 'logical_resource_id'),
+        ('physical_resource_id', 'physical_resource_id'),
+        ('no_echo', True),
+        ('data', {
+            'a': 1,
+            'b': 2,
+            'c': 3
+        }),
+    ]
+)
+def test_response_attributes(response_obj, attr, expected):
+    assert getattr(response_obj, attr) == expected
+
+
+def test_set_status(response_obj):
+    response_obj.set_status(True)
+    assert 'SUCCESS' == response_obj.status
+    response_obj.set_status(False)
+    assert 'FAILED' == response_obj.status
+
+
+def test_set_reason(response_obj):
+    response_obj.set_reason('')
+    assert '' == response_obj.reason
+
+
+def test_set_physical_resource_id(response_obj):
+    response_obj.set_physical_resource_id('1337')
+    assert '1337' == response_obj.physical_resource_id
+
+
+def test_set_data(response_obj):
+    response_obj.set_data({'a': 1, 'b': 2, 'c': 3})
+    assert {'a': 1, 'b': 2, 'c': 3} == response_obj.data
+    kwargs = {}
+    r = Response(**kwargs)
+    r.set_data({'a': 1, 'b': 2, 'c': 3})
+    assert {'a': 1, 'b': 2, 'c': 3} == r.data
+
+
+def test_dict(response_obj):
+    assert {
+        'Status': 'status',
+        'Reason': 'reason',
+        'StackId': 'stack_id',
+        'RequestId': 'request_id',
+        'LogicalResourceId': 'logical_resource_id',
+        'PhysicalResourceId': 'physical_resource_id',
+        'NoEcho': True,
+        'Data': {
+            'a': 1,
+            'b': 2,
+            'c': 3
+        }
+    } == response_obj.dict()
+
+
+def test_dict_omits_unset_fields():
+    d = Response().dict()
+    assert 'Status' not in d
+    assert 'Reason' not in d
+    assert set(Response._WIRE_FIELDS) - {'Status', 'Reason'} == set(d)
+
+
+def test_dict_rejects_unknown_fields():
+    # __slots__ is limited to the wire fields, so an unknown field can
+    # never be attached, let alone leak into the payload
+    with pytest.raises(AttributeError):
+        Response(Extra='extra')
+
+
+def test_to_json_bytes(response_obj):
+    body = response_obj.to_json_bytes()
+    assert response_obj.dict() == json.loads(body)
+
+
+def test_provider_init(provider_obj, request_obj, response_obj):
+    assert provider_obj.request == request_obj
+    assert provider_obj.response == response_obj
+
+
+def test_provider_set_response(provider_obj):
+    r = Response()
+    provider_obj._set_response(r)
+    assert r == provider_obj.response
+
+
+def test_provider_create(provider_obj):
+    with pytest.raises(NotImplementedError):
+        provider_obj.create()
+
+
+def test_provider_update(provider_obj):
+    with pytest.raises(NotImplementedError):
+        provider_obj.update()
+
+
+def test_provider_delete(provider_obj):
+    with pytest.raises(NotImplementedError):
+        provider_obj.delete()
+
+
+@pytest.mark.parametrize(
+    'request_type, target', [
+        ('Create', 'create'),
+        ('Update', 'update'),
+        ('Delete', 'delete'),
+    ]
+)
+def test_handler(response_obj, mock_send_response, request_type, target):
+    with patch.object(Provider, target) as mock_method:
+        request = Request(**HANDLER_REQUEST_KWARGS[request_type])
+        provider = Provider(request, response_obj)
         provider.handler()
-        self.assertEqual('FAILED', self.provider.response.status)
-        self.assertEqual(
-            'Unknown RequestType: Must be one of: Create, Update, or Delete.',
-            self.provider.response.reason
-        )
-        self.mock_send_response.assert_called_once()
-
-    def test_send_response(self):
-        self.provider.send_response()
-        self.mock_requests.put.assert_called_with(
-            'response_url',
-            json=self.provider.response.dict(),
-            headers={'Content-Type': ''}
-        )
+        mock_method.assert_called_once()
+    mock_send_response.assert_called_once()
+
+
+def test_handler_unknown(response_obj, mock_send_response):
+    request = Request(**HANDLER_REQUEST_KWARGS['Unknown'])
+    provider = Provider(request, response_obj)
+    provider.handler()
+    assert 'FAILED' == provider.response.status
+    assert (
+        'Unknown RequestType: Must be one of: Create, Update, or Delete.'
+        == provider.response.reason
+    )
+    mock_send_response.assert_called_once()
+
+
+def test_send_response(provider_obj, http_session):
+    provider_obj.send_response()
+    body = provider_obj.response.to_json_bytes()
+    http_session.put.assert_called_with(
+        'response_url',
+        data=body,
+        headers={
+            'Content-Type': '',
+            'Content-Length': str(len(body))
+        },
+        timeout=_TIMEOUT
+    )
@@ -1,433 +1,476 @@
-# -*- coding: utf-8 -*-
 """Tests for the `resources` module."""
 
-from unittest.mock import call, patch
+from unittest.mock import Mock, call, patch
 
+import pytest
 from botocore import exceptions
 
 from certificate_validator import resources
+from certificate_validator.exceptions import ResourceRecordsNotAvailable
+from certificate_validator.provider import Request
 from certificate_validator.resources import (
     Action, Certificate, CertificateMixin, CertificateValidator
 )
 
-from .base import (
-    BaseTestCase, CertificateBaseTestCase, CertificateValidatorBaseTestCase
+from .conftest import (
+    CERTIFICATE_ARN, CERTIFICATE_VALIDATOR_REQUEST_KWARGS, swap_attr
 )
 
+CLIENT_ERROR_REASON = 'Code: Message'
 
-class ActionTestCase(BaseTestCase):
-    def setUp(self):
-        super(ActionTestCase, self).setUp()
+RESOURCE_RECORD = {
+    'Name': '_x1.certificate-validator.com.',
+    'Type': 'CNAME',
+    'Value': '_x2.acm-validations.aws.'
+}
 
-    def test_class(self):
-        self.assertEqual('CREATE', Action.CREATE.value)
-        self.assertEqual('UPSERT', Action.UPSERT.value)
-        self.assertEqual('DELETE', Action.DELETE.value)
+RESOURCE_RECORD_2 = {
+    'Name': '_x3.www.certificate-validator.com.',
+    'Type': 'CNAME',
+    'Value': '_x4.acm-validations.aws.'
+}
 
+DOMAIN_VALIDATION_OPTION = {
+    'DomainName': 'certificate-validator.com',
+    'ResourceRecord': RESOURCE_RECORD
+}
 
-class CertificateMixinTestCase(BaseTestCase):
-    def setUp(self):
-        super(CertificateMixinTestCase, self).setUp()
+DOMAIN_VALIDATION_OPTION_2 = {
+    'DomainName': 'www.certificate-validator.com',
+    'ResourceRecord': RESOURCE_RECORD_2
+}
 
-    def test_is_valid_arn(self):
-        valid_arn = 'arn:aws:acm:us-east-1:123:certificate/1337'
-        self.assertTrue(CertificateMixin().is_valid_arn(valid_arn))
-        invalid_arn = 'invalid'
-        self.assertFalse(CertificateMixin().is_valid_arn(invalid_arn))
 
+@pytest.fixture
+def mock_cv_change_resource_record_sets(boto3_session):
+    """Patch change_resource_record_sets for the create/update/delete
+    tests, which only exercise the surrounding orchestration."""
+    with patch.object(
+            resources.CertificateValidator, 'change_resource_record_sets'
+    ) as mock_method:
+        yield mock_method
 
-class CertificateTestCase(CertificateBaseTestCase):
-    def setUp(self):
-        super(CertificateTestCase, self).setUp()
 
-    def test_init(self):
-        c = Certificate(self.request, self.response)
-        self.assertEqual(self.request, c.request)
-        self.assertEqual(self.response, c.response)
+@pytest.fixture
+def cv(cv_mocks, mock_request, mock_response):
+    """A CertificateValidator for the change_resource_record_sets tests.
 
-    def test_create_success(self):
-        c = Certificate(self.request, self.mock_response)
-        c.create()
-        self.mock_request_certificate.assert_called_with(
-            domain_name='certificate-validator.com',
-            subject_alternative_names=['www.certificate-validator.com'],
-        )
-        self.mock_response.set_status.assert_called_with(success=True)
-        self.mock_response.set_physical_resource_id.assert_called_with(
-            physical_resource_id='arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_response.set_data.assert_called_with({
-            'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1337'
-        })
+    Construction is hoisted here so the tests only configure the mocks
+    they care about instead of each rebuilding the same object graph.
+    """
+    mock_request.resource_properties = {'CertificateArn': CERTIFICATE_ARN}
+    return CertificateValidator(mock_request, mock_response)
 
-    def test_create_failed(self):
-        c = Certificate(self.request, self.mock_response)
-        self.mock_request_certificate.side_effect = exceptions.ClientError(
-            error_response={'Error': {
-                'Code': 'Code',
-                'Message': 'Message'
-            }},
-            operation_name='Operation'
-        )
-        c.create()
-        self.mock_request_certificate.assert_called_with(
-            domain_name='certificate-validator.com',
-            subject_alternative_names=['www.certificate-validator.com'],
-        )
-        self.mock_response.set_status.assert_called_with(success=False)
-        reason = \
-            'An error occurred (Code) when calling the Operation operation: ' \
-            'Message'
-        self.mock_response.set_reason.assert_called_with(reason=reason)
-
-    def test_update(self):
-        c = Certificate(self.request, self.response)
-        mock_create = patch.object(c, 'create').start()
+
+def test_action_class():
+    assert 'CREATE' == Action.CREATE.value
+    assert 'UPSERT' == Action.UPSERT.value
+    assert 'DELETE' == Action.DELETE.value
+
+
+# the mixin is stateless, so one instance serves every case
+_MIXIN = CertificateMixin()
+
+
+@pytest.mark.parametrize(
+    'arn, expected', [
+        ('arn:aws:acm:us-east-1:123:certificate/1337', True),
+        ('invalid', False),
+        ('arn:aws:acm:us-east-1:123:certificate/' + 'a' * 2048, False),
+    ],
+    ids=['valid', 'invalid', 'too_long']
+)
+def test_is_valid_arn(arn, expected):
+    assert _MIXIN.is_valid_arn(arn) is expected
+
+
+def test_certificate_init(boto3_session, certificate_request, response_obj):
+    c = Certificate(certificate_request, response_obj)
+    assert certificate_request == c.request
+    assert response_obj == c.response
+
+
+def test_certificate_init_injected_client(
+    boto3_session, certificate_request, response_obj
+):
+    acm = Mock()
+    c = Certificate(certificate_request, response_obj, acm=acm)
+    assert acm is c.acm
+
+
+def test_certificate_create_success(
+    certificate_mocks, certificate_request, mock_response
+):
+    c = Certificate(certificate_request, mock_response)
+    c.create()
+    certificate_mocks.request_certificate.assert_called_with(
+        domain_name='certificate-validator.com',
+        subject_alternative_names=['www.certificate-validator.com'],
+    )
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_physical_resource_id.assert_called_with(
+        physical_resource_id='arn:aws:acm:us-east-1:123:certificate/1337'
+    )
+    mock_response.set_data.assert_called_with({
+        'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1337'
+    })
+
+
+def test_certificate_create_failed(
+    certificate_mocks, certificate_request, mock_response, client_error
+):
+    c = Certificate(certificate_request, mock_response)
+    certificate_mocks.request_certificate.side_effect = client_error
+    c.create()
+    certificate_mocks.request_certificate.assert_called_with(
+        domain_name='certificate-validator.com',
+        subject_alternative_names=['www.certificate-validator.com'],
+    )
+    mock_response.set_status.assert_called_with(success=False)
+    mock_response.set_reason.assert_called_with(reason=CLIENT_ERROR_REASON)
+
+
+def test_certificate_update(
+    boto3_session, certificate_request, response_obj
+):
+    c = Certificate(certificate_request, response_obj)
+    with patch.object(c, 'create') as mock_create:
         c.update()
         mock_create.assert_called_once()
 
-    def test_delete_success_certificate_does_not_exist(self):
-        self.mock_request.physical_resource_id = ''
-        c = Certificate(self.mock_request, self.mock_response)
-        c.delete()
-        self.mock_response.set_status.assert_called_with(success=True)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Certificate does not exist.'
-        )
 
-    def test_delete_success_certificate_not_found(self):
-        self.mock_request.physical_resource_id = \
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        self.mock_delete_certificate.side_effect = exceptions.ClientError(
-            error_response={
-                'Error': {
-                    'Code': 'ResourceNotFoundException',
-                    'Message': 'Message'
-                }
-            },
+def test_certificate_delete_success_certificate_does_not_exist(
+    certificate_mocks, mock_request, mock_response
+):
+    mock_request.physical_resource_id = ''
+    c = Certificate(mock_request, mock_response)
+    c.delete()
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='Certificate does not exist.'
+    )
+
+
+def test_certificate_delete_success_certificate_not_found(
+    certificate_mocks, mock_request, mock_response
+):
+    mock_request.physical_resource_id = \
+        'arn:aws:acm:us-east-1:123:certificate/1337'
+    certificate_mocks.delete_certificate.side_effect = exceptions.ClientError(
+        error_response={
+            'Error': {
+                'Code': 'ResourceNotFoundException',
+                'Message': 'Message'
+            }
+        },
+        operation_name='Operation'
+    )
+    c = Certificate(mock_request, mock_response)
+    c.delete()
+    certificate_mocks.delete_certificate.assert_called_with(
+        certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
+    )
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='Certificate not found.'
+    )
+
+
+def test_certificate_delete_success(
+    certificate_mocks, mock_request, mock_response
+):
+    mock_request.physical_resource_id = \
+        'arn:aws:acm:us-east-1:123:certificate/1337'
+    c = Certificate(mock_request, mock_response)
+    c.delete()
+    certificate_mocks.delete_certificate.assert_called_with(
+        certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
+    )
+    mock_response.set_status.assert_called_with(success=True)
+
+
+def test_certificate_delete_failed_certificate_arn_is_invalid(
+    certificate_mocks, mock_request, mock_response
+):
+    mock_request.physical_resource_id = 'invalid'
+    c = Certificate(mock_request, mock_response)
+    c.delete()
+    mock_response.set_status.assert_called_with(success=False)
+    mock_response.set_reason.assert_called_with(
+        reason='Certificate ARN is invalid.'
+    )
+
+
+def test_certificate_delete_failed(
+    certificate_mocks, mock_request, mock_response, client_error
+):
+    mock_request.physical_resource_id = \
+        'arn:aws:acm:us-east-1:123:certificate/1337'
+    c = Certificate(mock_request, mock_response)
+    certificate_mocks.delete_certificate.side_effect = client_error
+    c.delete()
+    certificate_mocks.delete_certificate.assert_called_with(
+        certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
+    )
+    mock_response.set_status.assert_called_with(success=False)
+    mock_response.set_reason.assert_called_with(reason=CLIENT_ERROR_REASON)
+
+
+def test_cv_init(boto3_session, cv_request, response_obj):
+    cv = CertificateValidator(cv_request, response_obj)
+    assert cv_request == cv.request
+    assert response_obj == cv.response
+
+
+def test_cv_init_injected_clients(boto3_session, cv_request, response_obj):
+    acm = Mock()
+    route53 = Mock()
+    cv = CertificateValidator(
+        cv_request, response_obj, acm=acm, route53=route53
+    )
+    assert acm is cv.acm
+    assert route53 is cv.route53
+
+
+def test_change_resource_record_sets_failed_certificate_arn_is_invalid(
+    cv, mock_response
+):
+    cv.change_resource_record_sets('invalid', Action.CREATE)
+    mock_response.set_status.assert_called_with(success=False)
+    mock_response.set_reason.assert_called_with(
+        reason='Certificate ARN is invalid.'
+    )
+
+
+@pytest.mark.parametrize(
+    'action, action_str', [
+        (Action.CREATE, 'CREATE'),
+        (Action.UPSERT, 'UPSERT'),
+        (Action.DELETE, 'DELETE'),
+    ]
+)
+def test_change_resource_record_sets_success(
+    cv, cv_mocks, mock_response, action, action_str
+):
+    cv.change_resource_record_sets(CERTIFICATE_ARN, action)
+    cv_mocks.get_hosted_zone_id.assert_called_with(
+        'certificate-validator.com'
+    )
+    cv_mocks.get_domain_validation_options.assert_called_with(
+        'arn:aws:acm:us-east-1:123:certificate/1337'
+    )
+    cv_mocks.get_change.assert_called_with(action_str, RESOURCE_RECORD)
+    cv_mocks.change_resource_record_sets.assert_called_with(
+        hosted_zone_id='Z23ABC4XYZL05B',
+        change_batch={'Changes': [cv_mocks.get_change.return_value]}
+    )
+    mock_response.set_status.assert_called_with(success=True)
+
+
+def test_change_resource_record_sets_batches_by_zone(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.return_value = [
+        DOMAIN_VALIDATION_OPTION, DOMAIN_VALIDATION_OPTION_2
+    ]
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.UPSERT)
+    cv_mocks.change_resource_record_sets.assert_called_once_with(
+        hosted_zone_id='Z23ABC4XYZL05B',
+        change_batch={
+            'Changes': [
+                cv_mocks.get_change.return_value,
+                cv_mocks.get_change.return_value
+            ]
+        }
+    )
+    mock_response.set_status.assert_called_with(success=True)
+
+
+def test_change_resource_record_sets_chunks_batches(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.return_value = [
+        DOMAIN_VALIDATION_OPTION, DOMAIN_VALIDATION_OPTION_2
+    ]
+    with swap_attr(resources, '_CHANGE_BATCH_LIMIT', 1):
+        cv.change_resource_record_sets(CERTIFICATE_ARN, Action.UPSERT)
+    cv_mocks.change_resource_record_sets.assert_has_calls([
+        call(
+            hosted_zone_id='Z23ABC4XYZL05B',
+            change_batch={'Changes': [cv_mocks.get_change.return_value]}
+        ),
+        call(
+            hosted_zone_id='Z23ABC4XYZL05B',
+            change_batch={'Changes': [cv_mocks.get_change.return_value]}
+        )
+    ], any_order=True)
+    mock_response.set_status.assert_called_with(success=True)
+
+
+def test_change_resource_record_sets_no_options(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.return_value = []
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.UPSERT)
+    cv_mocks.change_resource_record_sets.assert_not_called()
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='No validation records to change.'
+    )
+
+
+def test_change_resource_record_sets_records_not_available(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.side_effect = \
+        ResourceRecordsNotAvailable()
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.DELETE)
+    cv_mocks.change_resource_record_sets.assert_not_called()
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='No validation records to change.'
+    )
+
+
+@pytest.mark.parametrize('action', [Action.CREATE, Action.UPSERT])
+def test_change_resource_record_sets_records_not_available_create(
+    cv, cv_mocks, mock_response, action
+):
+    cv_mocks.get_domain_validation_options.side_effect = \
+        ResourceRecordsNotAvailable()
+    with pytest.raises(ResourceRecordsNotAvailable):
+        cv.change_resource_record_sets(CERTIFICATE_ARN, action)
+    cv_mocks.change_resource_record_sets.assert_not_called()
+    mock_response.set_status.assert_not_called()
+
+
+@pytest.mark.parametrize('action', [Action.CREATE, Action.DELETE])
+def test_change_resource_record_sets_failed(
+    cv, cv_mocks, mock_response, client_error, action
+):
+    cv_mocks.get_domain_validation_options.side_effect = client_error
+    cv.change_resource_record_sets(CERTIFICATE_ARN, action)
+    mock_response.set_status.assert_called_with(success=False)
+    mock_response.set_reason.assert_called_with(reason=CLIENT_ERROR_REASON)
+
+
+def test_change_resource_record_sets_create_failed_invalid_cb(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.side_effect = \
+        exceptions.ClientError(
+            error_response={'Error': {
+                'Code': 'InvalidChangeBatch',
+                'Message': 'Message'
+            }},
             operation_name='Operation'
         )
-        c = Certificate(self.mock_request, self.mock_response)
-        c.delete()
-        self.mock_delete_certificate.assert_called_with(
-            certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_response.set_status.assert_called_with(success=True)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Certificate not found.'
-        )
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.DELETE)
+    mock_response.set_status.assert_called_with(success=False)
+    reason = 'InvalidChangeBatch: Message'
+    mock_response.set_reason.assert_called_with(reason=reason)
 
-    def test_delete_success(self):
-        self.mock_request.physical_resource_id = \
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        c = Certificate(self.mock_request, self.mock_response)
-        c.delete()
-        self.mock_delete_certificate.assert_called_with(
-            certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_response.set_status.assert_called_with(success=True)
-
-    def test_delete_failed_certificate_arn_is_invalid(self):
-        self.mock_request.physical_resource_id = 'invalid'
-        c = Certificate(self.mock_request, self.mock_response)
-        c.delete()
-        self.mock_response.set_status.assert_called_with(success=False)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Certificate ARN is invalid.'
-        )
 
-    def test_delete_failed(self):
-        self.mock_request.physical_resource_id = \
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        c = Certificate(self.mock_request, self.mock_response)
-        self.mock_delete_certificate.side_effect = exceptions.ClientError(
+def test_change_resource_record_sets_delete_failed_cert_not_found(
+    cv, cv_mocks, mock_response
+):
+    cv_mocks.get_domain_validation_options.side_effect = \
+        exceptions.ClientError(
             error_response={'Error': {
-                'Code': 'Code',
+                'Code': 'ResourceNotFoundException',
                 'Message': 'Message'
             }},
             operation_name='Operation'
         )
-        c.delete()
-        self.mock_delete_certificate.assert_called_with(
-            certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_response.set_status.assert_called_with(success=False)
-        reason = \
-            'An error occurred (Code) when calling the Operation operation: ' \
-            'Message'
-        self.mock_response.set_reason.assert_called_with(reason=reason)
-
-
-class CertificateValidatorTestCase(CertificateValidatorBaseTestCase):
-    def setUp(self):
-        super(CertificateValidatorTestCase, self).setUp()
-
-    def test_init(self):
-        cv = CertificateValidator(self.request, self.response)
-        self.assertEqual(self.request, cv.request)
-        self.assertEqual(self.response, cv.response)
-
-    def test_change_resource_record_sets_failed_certificate_arn_is_invalid(
-        self
-    ):
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets('invalid', Action.CREATE)
-        self.mock_response.set_status.assert_called_with(success=False)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Certificate ARN is invalid.'
-        )
-
-    def test_change_resource_record_sets_create_success(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.CREATE)
-        self.mock_get_hosted_zone_id.assert_called_with(
-            'certificate-validator.com'
-        )
-        self.mock_get_domain_validation_options.assert_called_with(
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_get_change_batch.assert_called_with(
-            'CREATE', {
-                'Name': '_x1.certificate-validator.com.',
-                'Type': 'CNAME',
-                'Value': '_x2.acm-validations.aws.'
-            }
-        )
-        self.mock_change_resource_record_sets.assert_called_with(
-            hosted_zone_id='Z23ABC4XYZL05B',
-            change_batch={
-                'Changes': {
-                    'ResourceRecordSet': {
-                        'Name': '_x1.certificate-validator.com.',
-                        'Type': 'CNAME',
-                        'TTL': 300,
-                        'ResourceRecords': [{
-                            'Value': '_x2.acm-validations.aws.'
-                        }]
-                    }
-                }
-            }
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.DELETE)
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='Certificate not found.'
+    )
+
+
+def test_change_resource_record_sets_delete_failed_rrset_not_found(
+    cv, cv_mocks, mock_response
+):
+    message = \
+        'Tried to delete resource record set ' \
+        '[name=\'_x1.certificate-validator.com.\', type=\'CNAME\'] but ' \
+        'it was not found'
+    cv_mocks.get_domain_validation_options.side_effect = \
+        exceptions.ClientError(
+            error_response={'Error': {
+                'Code': 'InvalidChangeBatch',
+                'Message': message
+            }},
+            operation_name='Operation'
         )
-        self.mock_response.set_status.assert_called_with(success=True)
+    cv.change_resource_record_sets(CERTIFICATE_ARN, Action.DELETE)
+    mock_response.set_status.assert_called_with(success=True)
+    mock_response.set_reason.assert_called_with(
+        reason='Resource Record Set not found.'
+    )
 
-    def test_change_resource_record_sets_create_failed(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        self.mock_get_domain_validation_options.side_effect = \
-            exceptions.ClientError(
-                error_response={'Error': {
-                    'Code': 'Code',
-                    'Message': 'Message'
-                }},
-                operation_name='Operation'
-            )
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.CREATE)
-        self.mock_response.set_status.assert_called_with(success=False)
-        reason = \
-            'An error occurred (Code) when calling the Operation operation: ' \
-            'Message'
-        self.mock_response.set_reason.assert_called_with(reason=reason)
-
-    def test_change_resource_record_sets_create_failed_invalid_cb(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        self.mock_get_domain_validation_options.side_effect = \
-            exceptions.ClientError(
-                error_response={'Error': {
-                    'Code': 'InvalidChangeBatch',
-                    'Message': 'Message'
-                }},
-                operation_name='Operation'
-            )
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.DELETE)
-        self.mock_response.set_status.assert_called_with(success=False)
-        reason = \
-            'An error occurred (InvalidChangeBatch) when calling the ' \
-            'Operation operation: Message'
-        self.mock_response.set_reason.assert_called_with(reason=reason)
-
-    def test_change_resource_record_sets_upsert(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.UPSERT)
-        self.mock_get_hosted_zone_id.assert_called_with(
-            'certificate-validator.com'
-        )
-        self.mock_get_domain_validation_options.assert_called_with(
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_get_change_batch.assert_called_with(
-            'UPSERT', {
-                'Name': '_x1.certificate-validator.com.',
-                'Type': 'CNAME',
-                'Value': '_x2.acm-validations.aws.'
-            }
-        )
-        self.mock_change_resource_record_sets.assert_called_with(
-            hosted_zone_id='Z23ABC4XYZL05B',
-            change_batch={
-                'Changes': {
-                    'ResourceRecordSet': {
-                        'Name': '_x1.certificate-validator.com.',
-                        'Type': 'CNAME',
-                        'TTL': 300,
-                        'ResourceRecords': [{
-                            'Value': '_x2.acm-validations.aws.'
-                        }]
-                    }
-                }
-            }
-        )
-        self.mock_response.set_status.assert_called_with(success=True)
 
-    def test_change_resource_record_sets_delete_success(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.DELETE)
-        self.mock_get_hosted_zone_id.assert_called_with(
-            'certificate-validator.com'
-        )
-        self.mock_get_domain_validation_options.assert_called_with(
-            'arn:aws:acm:us-east-1:123:certificate/1337'
-        )
-        self.mock_get_change_batch.assert_called_with(
-            'DELETE', {
-                'Name': '_x1.certificate-validator.com.',
-                'Type': 'CNAME',
-                'Value': '_x2.acm-validations.aws.'
-            }
-        )
-        self.mock_change_resource_record_sets.assert_called_with(
-            hosted_zone_id='Z23ABC4XYZL05B',
-            change_batch={
-                'Changes': {
-                    'ResourceRecordSet': {
-                        'Name': '_x1.certificate-validator.com.',
-                        'Type': 'CNAME',
-                        'TTL': 300,
-                        'ResourceRecords': [{
-                            'Value': '_x2.acm-validations.aws.'
-                        }]
-                    }
-                }
+def test_cv_create(
+    cv_mocks, mock_cv_change_resource_record_sets, cv_request, mock_response
+):
+    with patch.object(resources.ACM, 'wait') as mock_wait:
+        cv = CertificateValidator(cv_request, mock_response)
+        cv.create()
+    mock_response.set_physical_resource_id.assert_called_with('1337')
+    mock_cv_change_resource_record_sets.assert_called_with(
+        'arn:aws:acm:us-east-1:123:certificate/1', Action.UPSERT
+    )
+    mock_wait.assert_called_once_with(
+        'arn:aws:acm:us-east-1:123:certificate/1'
+    )
+
+
+def test_cv_update(
+    mock_cv_change_resource_record_sets, cv_request, mock_response
+):
+    cv = CertificateValidator(cv_request, mock_response)
+    cv.update()
+    mock_cv_change_resource_record_sets.assert_has_calls([
+        call('arn:aws:acm:us-east-1:123:certificate/0', Action.DELETE),
+        call('arn:aws:acm:us-east-1:123:certificate/1', Action.UPSERT)
+    ])
+
+
+def test_cv_update_same_certificate(
+    mock_cv_change_resource_record_sets, mock_response
+):
+    request = Request(
+        **{
+            **CERTIFICATE_VALIDATOR_REQUEST_KWARGS,
+            'OldResourceProperties': {
+                'ServiceToken': 'service_token',
+                'CertificateArn': 'arn:aws:acm:us-east-1:123:certificate/1',
             }
-        )
-        self.mock_response.set_status.assert_called_with(success=True)
-
-    def test_change_resource_record_sets_delete_failed(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        self.mock_get_domain_validation_options.side_effect = \
-            exceptions.ClientError(
-                error_response={'Error': {
-                    'Code': 'Code',
-                    'Message': 'Message'
-                }},
-                operation_name='Operation'
-            )
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.DELETE)
-        self.mock_response.set_status.assert_called_with(success=False)
-        reason = \
-            'An error occurred (Code) when calling the Operation operation: ' \
-            'Message'
-        self.mock_response.set_reason.assert_called_with(reason=reason)
-
-    def test_change_resource_record_sets_delete_failed_cert_not_found(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
         }
-        self.mock_get_domain_validation_options.side_effect = \
-            exceptions.ClientError(
-                error_response={'Error': {
-                    'Code': 'ResourceNotFoundException',
-                    'Message': 'Message'
-                }},
-                operation_name='Operation'
-            )
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.DELETE)
-        self.mock_response.set_status.assert_called_with(success=True)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Certificate not found.'
-        )
-
-    def test_change_resource_record_sets_delete_failed_rrset_not_found(self):
-        self.mock_request.resource_properties = {
-            'CertificateArn': self.certificate_arn
-        }
-        message = \
-            'Tried to delete resource record set ' \
-            '[name=\'_x1.certificate-validator.com.\', type=\'CNAME\'] but ' \
-            'it was not found'
-        self.mock_get_domain_validation_options.side_effect = \
-            exceptions.ClientError(
-                error_response={'Error': {
-                    'Code': 'InvalidChangeBatch',
-                    'Message': message
-                }},
-                operation_name='Operation'
-            )
-        cv = CertificateValidator(self.mock_request, self.mock_response)
-        cv.change_resource_record_sets(self.certificate_arn, Action.DELETE)
-        self.mock_response.set_status.assert_called_with(success=True)
-        self.mock_response.set_reason.assert_called_with(
-            reason='Resource Record Set not found.'
-        )
-
-    def test_create(self):
-        mock_wait = patch.object(resources.ACM, 'wait').start()
-        mock_change_resource_record_sets = \
-            patch.object(resources.CertificateValidator,
-                         'change_resource_record_sets').start()
-        cv = CertificateValidator(self.request, self.mock_response)
-        cv.create()
-        self.mock_response.set_physical_resource_id.assert_called_with('1337')
-        mock_change_resource_record_sets.assert_called_with(
-            'arn:aws:acm:us-east-1:123:certificate/1', Action.UPSERT
-        )
-        mock_wait.assert_called_once_with(
-            'arn:aws:acm:us-east-1:123:certificate/1'
-        )
-
-    def test_update(self):
-        mock_change_resource_record_sets = \
-            patch.object(resources.CertificateValidator,
-                         'change_resource_record_sets').start()
-        cv = CertificateValidator(self.request, self.mock_response)
-        cv.update()
-        mock_change_resource_record_sets.assert_has_calls([
-            call('arn:aws:acm:us-east-1:123:certificate/0', Action.DELETE),
-            call('arn:aws:acm:us-east-1:123:certificate/1', Action.UPSERT)
-        ])
-
-    def test_delete(self):
-        mock_change_resource_record_sets = \
-            patch.object(resources.CertificateValidator,
-                         'change_resource_record_sets').start()
-        cv = CertificateValidator(self.request, self.mock_response)
-        cv.delete()
-        mock_change_resource_record_sets.assert_called_with(
-            'arn:aws:acm:us-east-1:123:certificate/1', Action.DELETE
-        )
-
-    def test_get_domain_validation_options(self):
-        patch.stopall()
-        mock_describe_certificate = patch.object(
-            resources.ACM, 'describe_certificate'
-        ).start()
+    )
+    cv = CertificateValidator(request, mock_response)
+    cv.update()
+    mock_cv_change_resource_record_sets.assert_called_once_with(
+        'arn:aws:acm:us-east-1:123:certificate/1', Action.UPSERT
+    )
+
+
+def test_cv_delete(
+    mock_cv_change_resource_record_sets, cv_request, mock_response
+):
+    cv = CertificateValidator(cv_request, mock_response)
+    cv.delete()
+    mock_cv_change_resource_record_sets.assert_called_with(
+        'arn:aws:acm:us-east-1:123:certificate/1', Action.DELETE
+    )
+
+
+def test_get_domain_validation_options(
+    boto3_session, cv_request, response_obj
+):
+    with patch.object(resources.ACM, 'describe_certificate') as \
+            mock_describe_certificate:
         mock_describe_certificate.return_value = {
             'Certificate': {
                 'DomainName': 'certificate-validator.com',
@@ -441,26 +484,19 @@ class CertificateValidatorTestCase(CertificateValidatorBaseTestCase):
                 }]
             }
         }
-        cv = CertificateValidator(self.request, self.response)
+        cv = CertificateValidator(cv_request, response_obj)
         actual = cv.get_domain_validation_options(
             certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
         )
-        expected = [{
-            'DomainName': 'certificate-validator.com',
-            'ResourceRecord': {
-                'Name': '_x1.certificate-validator.com.',
-                'Type': 'CNAME',
-                'Value': '_x2.acm-validations.aws.'
-            }
-        }]
-        self.assertEqual(expected, actual)
-
-    def test_get_domain_validation_options_poll(self):
-        patch.stopall()
-        patch('time.sleep', return_value=None).start()
-        mock_describe_certificate = patch.object(
-            resources.ACM, 'describe_certificate'
-        ).start()
+    expected = [DOMAIN_VALIDATION_OPTION]
+    assert expected == actual
+
+
+def test_get_domain_validation_options_poll(
+    boto3_session, cv_request, response_obj
+):
+    with patch.object(resources.ACM, 'describe_certificate') as \
+            mock_describe_certificate:
         mock_describe_certificate.side_effect = [{
             'Certificate': {
                 'DomainName': 'certificate-validator.com',
@@ -481,58 +517,119 @@ class CertificateValidatorTestCase(CertificateValidatorBaseTestCase):
                 }]
             }
         }]
-        cv = CertificateValidator(self.request, self.response)
+        cv = CertificateValidator(cv_request, response_obj)
         actual = cv.get_domain_validation_options(
             certificate_arn='arn:aws:acm:us-east-1:123:certificate/1337'
         )
-        expected = [{
-            'DomainName': 'certificate-validator.com',
-            'ResourceRecord': {
-                'Name': '_x1.certificate-validator.com.',
-                'Type': 'CNAME',
-                'Value': '_x2.acm-validations.aws.'
+    expected = [DOMAIN_VALIDATION_OPTION]
+    assert expected == actual
+
+
+def test_get_domain_validation_options_timeout(
+    boto3_session, cv_request, response_obj
+):
+    with patch.object(resources.ACM, 'describe_certificate') as \
+            mock_describe_certificate:
+        mock_describe_certificate.return_value = {
+            'Certificate': {
+                'DomainName': 'certificate-validator.com',
+                'DomainValidationOptions': [{
+                    'DomainName': 'certificate-validator.com'
+                }],
             }
-        }]
-        self.assertEqual(expected, actual)
+        }
+        cv = CertificateValidator(cv_request, response_obj)
+        # patch the clock only after the validator, and with it the
+        # underlying botocore client, has been constructed
+        with patch('time.monotonic') as mock_monotonic:
+            mock_monotonic.side_effect = [0, 0, 100]
+            with pytest.raises(ResourceRecordsNotAvailable):
+                cv.get_domain_validation_options(
+                    certificate_arn=CERTIFICATE_ARN
+                )
+
+
+def test_get_hosted_zone_id(boto3_session, cv_request, response_obj):
+    with patch.object(resources.Route53, 'list_hosted_zones_by_name') as \
+            mock_list_hosted_zones_by_name:
+        mock_list_hosted_zones_by_name.return_value = {
+            'HostedZones': [{
+                'Id': '/hostedzone/Z23ABC4XYZL05B',
+                'Name': 'certificate-validator.com.',
+            }]
+        }
+        cv = CertificateValidator(cv_request, response_obj)
+        actual = cv.get_hosted_zone_id(
+            domain_name='certificate-validator.com'
+        )
+    expected = 'Z23ABC4XYZL05B'
+    assert expected == actual
 
-    def test_get_hosted_zone_id(self):
-        patch.stopall()
-        mock_list_hosted_zones_by_name = patch.object(
-            resources.Route53, 'list_hosted_zones_by_name'
-        ).start()
+
+def test_get_hosted_zone_id_cached(boto3_session, cv_request, response_obj):
+    with patch.object(resources.Route53, 'list_hosted_zones_by_name') as \
+            mock_list_hosted_zones_by_name:
         mock_list_hosted_zones_by_name.return_value = {
             'HostedZones': [{
                 'Id': '/hostedzone/Z23ABC4XYZL05B',
                 'Name': 'certificate-validator.com.',
             }]
         }
-        cv = CertificateValidator(self.request, self.response)
-        actual = cv.get_hosted_zone_id(domain_name='certificate-validator.com')
-        expected = 'Z23ABC4XYZL05B'
-        self.assertEqual(expected, actual)
-
-    def test_get_change_batch(self):
-        patch.stopall()
-        cv = CertificateValidator(self.request, self.response)
-        resource_record = {
+        cv = CertificateValidator(cv_request, response_obj)
+        cv.get_hosted_zone_id(domain_name='certificate-validator.com')
+        cv.get_hosted_zone_id(domain_name='certificate-validator.com')
+        mock_list_hosted_zones_by_name.assert_called_once()
+
+
+def test_clients_are_cached(boto3_session, cv_request, response_obj):
+    cv1 = CertificateValidator(cv_request, response_obj)
+    cv2 = CertificateValidator(cv_request, response_obj)
+    assert cv1.acm is cv2.acm
+    assert cv1.route53 is cv2.route53
+
+
+def test_clients_prefer_lambda_singletons(boto3_session):
+    acm = Mock()
+    route53 = Mock()
+    with swap_attr(resources.api, 'ACM_CLIENT', acm), \
+            swap_attr(resources.api, 'ROUTE53_CLIENT', route53):
+        assert resources._get_acm(None) is acm
+        assert resources._get_route53() is route53
+
+
+def test_get_change(boto3_session, cv_request, response_obj):
+    cv = CertificateValidator(cv_request, response_obj)
+    actual = cv.get_change(action='CREATE', resource_record=RESOURCE_RECORD)
+    expected = {
+        'Action': 'CREATE',
+        'ResourceRecordSet': {
             'Name': '_x1.certificate-validator.com.',
             'Type': 'CNAME',
-            'Value': '_x2.acm-validations.aws.'
-        }
-        actual = cv.get_change_batch(
-            action='CREATE', resource_record=resource_record
-        )
-        expected = {
-            'Changes': [{
-                'Action': 'CREATE',
-                'ResourceRecordSet': {
-                    'Name': '_x1.certificate-validator.com.',
-                    'Type': 'CNAME',
-                    'TTL': 300,
-                    'ResourceRecords': [{
-                        'Value': '_x2.acm-validations.aws.'
-                    }]
-                }
+            'TTL': 300,
+            'ResourceRecords': [{
+                'Value': '_x2.acm-validations.aws.'
             }]
         }
-        self.assertEqual(expected, actual)
+    }
+    assert expected == actual
+
+
+def test_get_change_batch(boto3_session, cv_request, response_obj):
+    cv = CertificateValidator(cv_request, response_obj)
+    actual = cv.get_change_batch(
+        action='CREATE', resource_record=RESOURCE_RECORD
+    )
+    expected = {
+        'Changes': [{
+            'Action': 'CREATE',
+            'ResourceRecordSet': {
+                'Name': '_x1.certificate-validator.com.',
+                'Type': 'CNAME',
+                'TTL': 300,
+                'ResourceRecords': [{
+                    'Value': '_x2.acm-validations.aws.'
+                }]
+            }
+        }]
+    }
+    assert expected == actual